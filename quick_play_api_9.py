@@ -10,9 +10,23 @@
 
 # Python Standerd Libraries.
 from __future__ import annotations 
-from typing import TYPE_CHECKING, override
-from dataclasses import dataclass
+from typing import TYPE_CHECKING, override, cast
+from dataclasses import dataclass, field
+from threading import Thread, Event
+from queue import SimpleQueue
 from copy import copy
+import importlib
+import importlib.util
+import ast
+import logging
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+import tracemalloc
+import weakref
 
 # Ballistica API's.
 import bascenev1 as bs
@@ -22,6 +36,8 @@ import bauiv1 as bui
 from bauiv1lib import popup
 from bascenev1lib import mainmenu
 from bascenev1lib.activity.multiteamvictory import TeamSeriesVictoryScoreScreenActivity
+from bascenev1lib.actor.zoomtext import ZoomText
+from bascenev1lib.actor.text import Text
 
 if TYPE_CHECKING:
     from typing import Any
@@ -32,30 +48,154 @@ class plg(bs.Plugin):
 
     @dataclass
     class Minigame:
-        gametype: type[bs.GameActivity]
+        module: str
+        classname: str
+        name: str
+        description: str
         supported_sessiontypes: list[type[bs.Session]]
         selected_sessiontype: type[bs.Session]
-
+        # Gametype makes its own display string/description; so 'name' and
+        # 'description' are not enough, we need to ask the gametype.
+        dynamic: bool = False
+        # The gametype class; imported only when it's actually needed.
+        _gametype: type[bs.GameActivity] | None = field(default=None, repr=False)
+
+        @property
+        def gametype(self) -> type[bs.GameActivity]:
+            """ The minigame's gametype class (imports its module if needed). """
+            if self._gametype is None:
+                module = importlib.import_module(self.module)
+                self._gametype = getattr(module, self.classname)
+            return self._gametype
+
+        def get_display_string(self) -> bui.Lstr:
+            """ Same as 'GameActivity.get_display_string', without the import. """
+            if self.dynamic:
+                return self.gametype.get_display_string()
+            return bui.Lstr(translate=("gameNames", self.name))
+
+    # Sessiontypes which our quick play can host.
+    sessiontypes: list[type[bs.Session]] = [
+        bs.DualTeamSession,
+        bs.FreeForAllSession,
+    ]
     # contains all custom minigames if found.
     custom_minigames: list[Minigame] = []
+    # Indexes of 'custom_minigames' by normalized name and by (module, classname).
+    # Always use plg._add_minigame/plg._remove_minigame to keep them in sync.
+    _minigames_by_name: dict[str, Minigame] = {}
+    _minigames_by_class: dict[tuple[str, str], Minigame] = {}
+    # Every prefix of name, module and description words of custom minigames
+    # to their (module, classname) keys; for our SettingsWindow search.
+    _search_index: dict[str, set[tuple[str, str]]] = {}
+    # (gametype, sessiontype) to its available settings, supported maps
+    # and description string; so our Play/description popups open instantly.
+    _metadata: dict[tuple[type[bs.GameActivity], type[bs.Session]], dict[str, Any]] = {}
+    # Minigames waiting for our one metadata prefetch thread.
+    _prefetch_queue: SimpleQueue[list[Minigame]] = SimpleQueue()
+    _prefetch_thread: Thread | None = None
     # User starts the minigame using our UI or not?
     quick_play: bool = False
     # The user selected gametype and its settings.
     _game_spec: dict[str, Any] = {}
+    # Queued games(gametype, settings and sessiontype) to play after
+    # the current one, in the same session.
+    _game_queue: list[dict[str, Any]] = []
 
     _editwindow_back_state: bui.MainWindowState | None = None
+    # Max recently launched games(gametype, sessiontype and settings)
+    # we keep in app config, latest first.
+    _RECENT_MAX: int = 8
+
+    # Name of the winner of our last quick play game.
+    last_winner: str | bs.Lstr | None = None
+
+    # Soak test state(results and options) while it's running.
+    _soak: dict[str, Any] | None = None
+    _SOAK_REPORT_FILE_NAME: str = "quick_play_soak_report.json"
+
+    # Local players joining our lobby get ready on their own after this delay;
+    # small wait so other local players can press a button and join too.
+    _AUTO_JOIN_DELAY: float = 1.0
+    # When our join lobby began; to know how long it took.
+    _lobby_begin_time: float = 0.0
+
+    # Media of selected minigame preloaded while we're in join lobby.
+    # Held until our game activity is made; so it doesn't get unloaded.
+    _preloads: list[Any] = []
+
+    # On-disk index of custom minigames, so we don't need to import
+    # every mod on every launch. Bump the version when its format changes.
+    _CACHE_VERSION: int = 4
+    _CACHE_FILE_NAME: str = "quick_play_minigames.json"
+
+    # How often(in seconds) we look for changed minigames in mods folder.
+    _WATCH_INTERVAL: float = 2.0
+    # Set to stop the running mods watcher; None if there's none.
+    _watch_stop: Event | None = None
+    # '# ba_meta export <type>' line followed by a class.
+    _EXPORT_PATTERN: re.Pattern[str] = re.compile(
+        r"^#\s*ba_meta\s+export\s+(\S+)[^\n]*\n"
+        r"(?:[ \t]*(?:#[^\n]*)?\n)*"
+        r"class\s+(\w+)",
+        re.MULTILINE,
+    )
+    _GAMETYPE_EXPORTS: tuple[str, ...] = ("bascenev1.GameActivity", "game")
+
+    # Headless/server quick play config; in config directory, or the
+    # path in 'QUICK_PLAY_CONFIG' environment variable. Like:
+    # {"gametype": "mymod.MyGame", "sessiontype": "DualTeamSession",
+    #  "settings": {"map": "Courtyard", "Time Limit": 120}}
+    _SERVER_CONFIG_FILE_NAME: str = "quick_play_server.json"
+    # Stock base classes of gametypes; we know what they support.
+    _GAMETYPE_BASES: tuple[str, ...] = ("GameActivity", "TeamGameActivity")
+    # If a gametype has its own of these, we can't know its texts without importing.
+    _DYNAMIC_METHODS: tuple[str, ...] = (
+        "get_display_string",
+        "get_description",
+        "get_description_display_string",
+    )
+
+    # Mods which failed to import are quarantined; we won't import them
+    # again untill they're changed. Ones which took longer than this(in seconds)
+    # are reported, and hidden from next launch only if user asks for it
+    # ("Quick Play Quarantine Slow Mods"; turn it off to list them again).
+    _SLOW_IMPORT_TIME: float = 5.0
+    _REPORT_FILE_NAME: str = "quick_play_import_report.json"
+    # module to import time, memory delta and error of mods imported this run.
+    _import_report: dict[str, dict[str, Any]] = {}
+    # quarantined module to its reason.
+    _quarantined: dict[str, str] = {}
 
     @override
     def on_app_running(self) -> None:
         """ Called when app reach run state. """
 
-        # loadding exported "bascenev1.GameActivity" classses.
-        bui.app.meta.load_exported_classes(
-            bs.GameActivity, 
-            plg._list_custom_gametypes, # It'll call provided function with loaded gametypes as list. 
-            completion_cb_in_bg_thread=True,
-        )
+        # No UI to show minigames in; just host what the config says.
+        if bui.app.env.headless:
+            plg._setup_headless()
+            return
+
+        # loadding custom minigames in bg thread; (re)importing only
+        # the mods which are new or changed since our last launch.
+        Thread(target=plg._load_custom_gametypes, daemon=True).start()
         
+    @override
+    def on_app_suspend(self) -> None:
+        """ Called when app is suspended. """
+        plg._stop_watching(forever=False)
+
+    @override
+    def on_app_unsuspend(self) -> None:
+        """ Called when app is back from suspend. """
+        if plg._watch_stop is not None:
+            plg._start_watching()
+
+    @override
+    def on_app_shutdown(self) -> None:
+        """ Called when app is shutting down. """
+        plg._stop_watching()
+
     @override
     def has_settings_ui(self) -> bool:
         """ Called to ask if we have settings. """
@@ -73,49 +213,852 @@ class plg(bs.Plugin):
             return
         # replacing..
         main_window.main_window_replace(SettingsWindow(origin_widget=source_widget)) 
-    
-    def _list_custom_gametypes(gametypes: list[type[bs.GameActivity]]) -> None:
-        """ Called to list custom/plugin's minigame from all exported gametypes. """
-        
-        sessiontypes = [
-            bs.DualTeamSession, 
-            bs.FreeForAllSession,
-        ]
-        for gametype in gametypes:
-            # standerd/default gametypes are exported from "bascenev1lib/game/".
-            # and custom gametypes are exported from "mods fold or workspace".  
-            # Using that difference we can differ the standerd and custom gametypes.
-            if not gametype.__module__.startswith("bascenev1lib"): 
-                # incase we got same gametypes from mods and workspace.
-                if any([
-                    gametype.name.strip().lower() == mg.gametype.name.strip().lower() # hmm.. comparing names..
-                    for mg in plg.custom_minigames]):
-                    continue
-                # Finding supported sessiontypes for minigame.
-                supported_sessiontypes = [
-                    sessiontype for sessiontype in sessiontypes
-                    if gametype.supports_session_type(sessiontype)
+
+    def _cache_path() -> str:
+        """ Path of our minigames cache file. """
+        return os.path.join(bui.app.env.cache_directory, plg._CACHE_FILE_NAME)
+
+    def _read_cache() -> dict[str, Any]:
+        """ Called to read our minigames cache; empty if missing or outdated. """
+        try:
+            with open(plg._cache_path(), encoding="utf-8") as infile:
+                cache = json.load(infile)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(cache, dict) or cache.get("version") != plg._CACHE_VERSION:
+            return {}
+        return cache.get("files", {})
+
+    def _write_cache(files: dict[str, Any]) -> None:
+        """ Called to write our minigames cache. """
+        path = plg._cache_path()
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # write and swap; so a crash never leave a half written cache.
+            with open(path + ".tmp", "w", encoding="utf-8") as outfile:
+                json.dump({"version": plg._CACHE_VERSION, "files": files}, outfile)
+            os.replace(path + ".tmp", path)
+        except OSError:
+            logging.exception("Error writing quick play cache '%s'.", path)
+
+    def _file_hash(path: str) -> str:
+        """ Called to get hash of a mod source file. """
+        with open(path, "rb") as infile:
+            return hashlib.sha1(infile.read()).hexdigest()
+
+    def _load_custom_gametypes() -> None:
+        """ Called in bg thread to find custom minigames from exported gametypes. """
+
+        scanresults = bui.app.meta.scanresults
+        assert scanresults is not None
+
+        # standerd/default gametypes are exported from "bascenev1lib/game/".
+        # and custom gametypes are exported from "mods fold or workspace".  
+        # Using that difference we can differ the standerd and custom gametypes.
+        modules: dict[str, list[str]] = {}
+        for classpath in scanresults.exports_of_class(bs.GameActivity):
+            module, _, classname = classpath.rpartition(".")
+            if not module.startswith("bascenev1lib"):
+                modules.setdefault(module, []).append(classname)
+
+        cache = plg._read_cache()
+        new_cache: dict[str, Any] = {}
+        minigames: list[plg.Minigame] = []
+
+        # Wanna know memory cost of each mod too? (it slows down imports)
+        profiling = bool(bui.app.config.get("Quick Play Profile Imports", False))
+        if profiling:
+            tracemalloc.start()
+        quarantine_slow = bool(
+            bui.app.config.get("Quick Play Quarantine Slow Mods", False))
+
+        for module, classnames in modules.items():
+            try:
+                spec = importlib.util.find_spec(module)
+                path = spec.origin if spec is not None else None
+                if path is None or not os.path.isfile(path):
+                    raise FileNotFoundError(module)
+                mtime = os.path.getmtime(path)
+            except Exception:
+                logging.exception("Error finding source of '%s'.", module)
+                continue
+
+            entry = cache.get(path)
+            imported_now = False
+            digest: str | None = None
+            # Same mtime means unchanged; else let's compare the contents.
+            if entry is not None and entry["mtime"] != mtime:
+                digest = plg._file_hash(path)
+                if entry["hash"] == digest:
+                    entry["mtime"] = mtime
+                else:
+                    entry = None
+
+            if entry is not None:
+                # unchanged mod; let's use our cache.
+                minigames += [
+                    plg._minigame_from_record(record)
+                    for record in entry["minigames"]
+                    if record["classname"] in classnames
                 ]
-                # incase got Coop or custom sessions.
-                if not supported_sessiontypes: 
-                    continue
-                # At first selecting first session as defualt.
-                selected_sessiontype = supported_sessiontypes[0]
-                # Adding Minigame dataclass with upper info.
-                plg.custom_minigames.append(
-                    plg.Minigame(
-                        gametype=gametype,
-                        supported_sessiontypes=supported_sessiontypes,
-                        selected_sessiontype=selected_sessiontype,
-                    )
+            elif (parsed := plg._parse_minigames(path, module, classnames)) is not None:
+                # new or changed mod, but reading its source was enough.
+                entry = {
+                    "mtime": mtime,
+                    "hash": digest or plg._file_hash(path),
+                    "minigames": [
+                        plg._minigame_record(minigame) for minigame in parsed],
+                }
+                minigames += parsed
+            else:
+                # new or changed mod; need to import it.
+                entry = {
+                    "mtime": mtime,
+                    "hash": digest or plg._file_hash(path),
+                    "minigames": [],
+                }
+                imported = plg._import_minigames(module, classnames)
+                imported_now = True
+                report = plg._import_report[module]
+                report["path"] = path
+                if imported is None:
+                    entry["quarantined"] = f"error: {report['error']}"
+                else:
+                    if report["time"] > plg._SLOW_IMPORT_TIME:
+                        # (measured in bg thread; so it may be a bit more than real)
+                        logging.warning(
+                            "Quick play: importing '%s' took %.2f s.",
+                            module, report["time"])
+                        entry["slow"] = round(report["time"], 2)
+                    entry["minigames"] = [
+                        plg._minigame_record(minigame) for minigame in imported]
+                    minigames += imported
+
+            if "quarantined" in entry:
+                plg._quarantined[module] = entry["quarantined"]
+            # Already paid for its import this run; so list it anyway.
+            elif "slow" in entry and quarantine_slow and not imported_now:
+                plg._quarantined[module] = f"slow: {entry['slow']:.2f}s"
+            new_cache[path] = entry
+
+        if profiling:
+            tracemalloc.stop()
+        plg._write_cache(new_cache)
+        plg._write_import_report()
+        plg._list_custom_gametypes(minigames, clear=True)
+
+        # We're already in bg thread; so let's fill metadata of the
+        # minigames which we had to import anyway.
+        plg._prefetch_metadata([
+            minigame for minigame in plg.custom_minigames
+            if minigame._gametype is not None
+        ])
+
+        # Now keep an eye on mods folder for changes; for mod makers.
+        if bui.app.config.get("Quick Play Hot Reload", False):
+            plg._start_watching()
+
+    def _import_minigames(
+        module: str, classnames: list[str], reload: bool = False
+    ) -> list[plg.Minigame] | None:
+        """ Called to (re)import a mod and make Minigames of its gametypes.
+
+        None if the mod failed to import. Its import time, memory delta
+        (only while tracemalloc is on) and error goes to plg._import_report.
+        """
+        report: dict[str, Any] = {"time": 0.0, "memory": None, "error": None}
+        plg._import_report[module] = report
+
+        memory = tracemalloc.get_traced_memory()[0]
+        start_time = time.perf_counter()
+        try:
+            if reload and module in sys.modules:
+                imported = importlib.reload(sys.modules[module])
+            else:
+                imported = importlib.import_module(module)
+        except Exception as exc:
+            logging.exception("Error importing '%s'.", module)
+            report["error"] = repr(exc)
+            return None
+        finally:
+            report["time"] = time.perf_counter() - start_time
+            if tracemalloc.is_tracing():
+                report["memory"] = tracemalloc.get_traced_memory()[0] - memory
+
+        minigames: list[plg.Minigame] = []
+        for classname in classnames:
+            gametype = getattr(imported, classname, None)
+            if gametype is None:
+                continue
+            minigame = plg._minigame_from_gametype(gametype)
+            if minigame is not None:
+                minigames.append(minigame)
+        return minigames
+
+    def _parse_minigames(
+        path: str, module: str, classnames: list[str]
+    ) -> list[plg.Minigame] | None:
+        """ Called to make Minigames of a mod by reading its source.
+
+        None if we can't tell everything without importing it.
+        """
+        try:
+            with open(path, encoding="utf-8") as infile:
+                tree = ast.parse(infile.read())
+        except (OSError, SyntaxError, ValueError):
+            return None
+
+        classes = {
+            node.name: node for node in tree.body
+            if isinstance(node, ast.ClassDef)
+        }
+        minigames: list[plg.Minigame] = []
+        for classname in classnames:
+            node = classes.get(classname)
+            info = plg._parse_gametype(node) if node is not None else None
+            if info is None:
+                return None
+            name, description, supported_sessiontypes = info
+            # incase got Coop or custom sessions.
+            if not supported_sessiontypes:
+                continue
+            minigames.append(
+                plg.Minigame(
+                    module=module,
+                    classname=classname,
+                    name=name,
+                    description=description,
+                    supported_sessiontypes=supported_sessiontypes,
+                    selected_sessiontype=supported_sessiontypes[0],
                 )
+            )
+        return minigames
+
+    def _parse_gametype(
+        node: ast.ClassDef
+    ) -> tuple[str, str, list[type[bs.Session]]] | None:
+        """ Called to read name, description and supported sessiontypes of a gametype class. """
+
+        # Only the direct subclasses of stock gametypes;
+        # else we don't know what they inherit.
+        for base in node.bases:
+            if isinstance(base, ast.Subscript): # TeamGameActivity[Player, Team]
+                base = base.value
+            base_name = (
+                base.attr if isinstance(base, ast.Attribute)
+                else base.id if isinstance(base, ast.Name)
+                else None
+            )
+            if base_name not in plg._GAMETYPE_BASES:
+                return None
+
+        values: dict[str, str] = {}
+        # Stock gametypes support both of our sessiontypes.
+        supported_sessiontypes = list(plg.sessiontypes)
+        for stmt in node.body:
+            if isinstance(stmt, (ast.Assign, ast.AnnAssign)):
+                targets = stmt.targets if isinstance(stmt, ast.Assign) else [stmt.target]
+                for target in targets:
+                    if isinstance(target, ast.Name) and target.id in ("name", "description"):
+                        if not (
+                            isinstance(stmt.value, ast.Constant)
+                            and isinstance(stmt.value.value, str)
+                        ):
+                            return None
+                        values[target.id] = stmt.value.value
+            elif isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                if stmt.name in plg._DYNAMIC_METHODS:
+                    return None
+                if stmt.name == "supports_session_type":
+                    parsed = plg._parse_supports_session_type(stmt)
+                    if parsed is None:
+                        return None
+                    supported_sessiontypes = parsed
+
+        if "name" not in values or "description" not in values:
+            return None
+        return values["name"], values["description"], supported_sessiontypes
+
+    def _parse_supports_session_type(
+        node: ast.FunctionDef | ast.AsyncFunctionDef
+    ) -> list[type[bs.Session]] | None:
+        """ Called to read sessiontypes from a simple 'supports_session_type'.
+
+        Like: 'return issubclass(sessiontype, bs.DualTeamSession) or ...'
+        """
+        body = [
+            stmt for stmt in node.body
+            if not (isinstance(stmt, ast.Expr) and isinstance(stmt.value, ast.Constant))
+        ] # no docstring.
+        if len(body) != 1 or not isinstance(body[0], ast.Return) or body[0].value is None:
+            return None
+
+        expr = body[0].value
+        if isinstance(expr, ast.Constant) and expr.value is True:
+            return list(plg.sessiontypes)
+        calls = (
+            expr.values
+            if isinstance(expr, ast.BoolOp) and isinstance(expr.op, ast.Or)
+            else [expr]
+        )
+        names: set[str] = set()
+        for call in calls:
+            if not (
+                isinstance(call, ast.Call)
+                and isinstance(call.func, ast.Name)
+                and call.func.id == "issubclass"
+                and len(call.args) == 2
+            ):
+                return None
+            arg = call.args[1]
+            if isinstance(arg, ast.Attribute):
+                names.add(arg.attr)
+            elif isinstance(arg, ast.Name):
+                names.add(arg.id)
+            else:
+                return None
+
+        return [
+            sessiontype for sessiontype in plg.sessiontypes
+            if sessiontype.__name__ in names or "MultiTeamSession" in names
+        ]
+
+    def _write_import_report() -> None:
+        """ Called to write our import report, slowest mods first. """
+
+        path = os.path.join(bui.app.env.cache_directory, plg._REPORT_FILE_NAME)
+        report = {
+            "quarantined": plg._quarantined,
+            "imports": dict(sorted(
+                plg._import_report.items(),
+                key=lambda item: item[1]["time"],
+                reverse=True,
+            )),
+        }
+        try:
+            with open(path, "w", encoding="utf-8") as outfile:
+                json.dump(report, outfile, indent=2)
+        except OSError:
+            logging.exception("Error writing quick play import report '%s'.", path)
+
+    def _exports(path: str) -> list[tuple[str, str]]:
+        """ Called to get (export type, class name) of a mod's exports, without importing it. """
+        try:
+            with open(path, encoding="utf-8") as infile:
+                source = infile.read()
+        except (OSError, ValueError):
+            return []
+        return plg._EXPORT_PATTERN.findall(source)
+
+    def _mod_mtimes() -> dict[str, float]:
+        """ Called to get mtime of every python file in mods folder. """
+
+        mtimes: dict[str, float] = {}
+        mods_dir = bui.app.env.python_directory_user
+        try:
+            with os.scandir(mods_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".py") and entry.is_file():
+                        mtimes[entry.path] = entry.stat().st_mtime
+        except OSError:
+            pass
+        return mtimes
+
+    def _start_watching() -> None:
+        """ Called to start watching mods folder in a bg thread. """
+        plg._stop_watching(forever=False)
+        plg._watch_stop = Event()
+        Thread(target=plg._watch_mods, args=(plg._watch_stop,), daemon=True).start()
+
+    def _stop_watching(forever: bool = True) -> None:
+        """ Called to stop the mods watcher; not forever keeps it to start again. """
+        if plg._watch_stop is not None:
+            plg._watch_stop.set()
+            if forever:
+                plg._watch_stop = None
+
+    def _watch_mods(stop: Event) -> None:
+        """ Called in bg thread to reload mods when they're added, changed or removed. """
+
+        mtimes = plg._mod_mtimes()
+        while not stop.wait(plg._WATCH_INTERVAL):
+            new_mtimes = plg._mod_mtimes()
+            changed = [
+                path for path, mtime in new_mtimes.items()
+                if mtimes.get(path) != mtime
+            ]
+            removed = [path for path in mtimes if path not in new_mtimes]
+            mtimes = new_mtimes
+            for path in changed + removed:
+                try:
+                    plg._reload_mod(path)
+                except Exception:
+                    logging.exception("Error reloading '%s'.", path)
+
+    def _reload_mod(path: str) -> None:
+        """ Called in bg thread to reload minigames of a changed mod. """
+
+        module = os.path.splitext(os.path.basename(path))[0]
+        exports = plg._exports(path)
+        # Reloading it would redo its plugin's monkeypatches; restart for those.
+        if any(
+            exporttype == "plugin" or exporttype.endswith(".Plugin")
+            for exporttype, _ in exports
+        ):
+            return
+        classnames = [
+            classname for exporttype, classname in exports
+            if exporttype in plg._GAMETYPE_EXPORTS
+        ]
+        had_minigames = any(
+            minigame.module == module for minigame in plg.custom_minigames)
+        # Not a minigame; don't wanna reload others' stuff.
+        if not classnames and not had_minigames:
+            return
+
+        minigames: list[plg.Minigame] = []
+        cache = plg._read_cache()
+        if classnames:
+            # Not imported yet? then reading it could be enough.
+            imported = (
+                plg._parse_minigames(path, module, classnames)
+                if module not in sys.modules else None
+            )
+            if imported is None:
+                imported = plg._import_minigames(module, classnames, reload=True)
+            if imported is None:
+                return # keep old ones untill they fix it.
+            minigames = imported
+            plg._quarantined.pop(module, None)
+            cache[path] = {
+                "mtime": os.path.getmtime(path),
+                "hash": plg._file_hash(path),
+                "minigames": [
+                    plg._minigame_record(minigame) for minigame in minigames],
+            }
+        else:
+            cache.pop(path, None)
+        plg._write_cache(cache)
+
+        bui.pushcall(
+            bui.Call(plg._replace_minigames, module, minigames),
+            from_other_thread=True,
+        )
+
+    def _replace_minigames(module: str, minigames: list[plg.Minigame]) -> None:
+        """ Called to replace listed minigames of a module with given ones. """
+
+        for minigame in [
+            mg for mg in plg.custom_minigames if mg.module == module
+        ]:
+            plg._remove_minigame(minigame)
+        for minigame in minigames:
+            plg._add_minigame(minigame)
+
+        # Let our window know, if it's open.
+        main_window = bui.app.ui_v1.get_main_window()
+        if isinstance(main_window, SettingsWindow):
+            main_window.refresh_minigames()
+        bui.screenmessage(
+            bui.Lstr(value=f"Reloaded '{module}'."), color=(0.0, 0.8, 0.4))
+
+    def _minigame_from_gametype(
+        gametype: type[bs.GameActivity]
+    ) -> plg.Minigame | None:
+        """ Called to make Minigame of gametype; None if we can't host it. """
+
+        # Finding supported sessiontypes for minigame.
+        supported_sessiontypes = [
+            sessiontype for sessiontype in plg.sessiontypes
+            if gametype.supports_session_type(sessiontype)
+        ]
+        # incase got Coop or custom sessions.
+        if not supported_sessiontypes: 
+            return None
+        dynamic = any(
+            getattr(getattr(gametype, method), "__func__", None)
+            is not getattr(getattr(bs.GameActivity, method), "__func__", None)
+            for method in plg._DYNAMIC_METHODS
+        )
+        return plg.Minigame(
+            module=gametype.__module__,
+            classname=gametype.__name__,
+            name=gametype.name,
+            description=str(gametype.description),
+            supported_sessiontypes=supported_sessiontypes,
+            # At first selecting first session as defualt.
+            selected_sessiontype=supported_sessiontypes[0],
+            dynamic=dynamic,
+            _gametype=gametype,
+        )
+
+    def _minigame_record(minigame: plg.Minigame) -> dict[str, Any]:
+        """ Called to get json-able cache record of minigame. """
+        return {
+            "module": minigame.module,
+            "classname": minigame.classname,
+            "name": minigame.name,
+            "description": minigame.description,
+            "sessiontypes": [
+                sessiontype.__name__
+                for sessiontype in minigame.supported_sessiontypes
+            ],
+            "dynamic": minigame.dynamic,
+        }
+
+    def _minigame_from_record(record: dict[str, Any]) -> plg.Minigame:
+        """ Called to make Minigame from our cache record. """
+        supported_sessiontypes = [
+            sessiontype for sessiontype in plg.sessiontypes
+            if sessiontype.__name__ in record["sessiontypes"]
+        ]
+        return plg.Minigame(
+            module=record["module"],
+            classname=record["classname"],
+            name=record["name"],
+            description=record["description"],
+            supported_sessiontypes=supported_sessiontypes,
+            selected_sessiontype=supported_sessiontypes[0],
+            dynamic=record["dynamic"],
+        )
+    
+    def _list_custom_gametypes(
+        minigames: list[plg.Minigame], clear: bool = False
+    ) -> None:
+        """ Called to list custom/plugin's minigames. """
+        
+        # re-populating from scratch.
+        if clear:
+            plg.custom_minigames.clear()
+            plg._minigames_by_name.clear()
+            plg._minigames_by_class.clear()
+            plg._search_index.clear()
+            plg._metadata.clear()
+
+        for minigame in minigames:
+            # Has been quarantined; broken or too slow to import.
+            if minigame.module in plg._quarantined:
+                continue
+            plg._add_minigame(minigame)
+
+    def _normalize_name(name: str) -> str:
+        return name.strip().lower()
+
+    def _add_minigame(minigame: plg.Minigame) -> bool:
+        """ Called to add a minigame to our list; False if it was a duplicate. """
+
+        # incase we got same gametypes from mods and workspace.
+        name = plg._normalize_name(minigame.name)
+        if name in plg._minigames_by_name:
+            return False
+        plg.custom_minigames.append(minigame)
+        plg._minigames_by_name[name] = minigame
+        plg._minigames_by_class[(minigame.module, minigame.classname)] = minigame
+        for prefix in plg._search_prefixes(minigame):
+            plg._search_index.setdefault(prefix, set()).add(
+                (minigame.module, minigame.classname))
+        return True
+
+    def _remove_minigame(minigame: plg.Minigame) -> None:
+        """ Called to remove a minigame from our list. """
+
+        plg.custom_minigames.remove(minigame)
+        del plg._minigames_by_name[plg._normalize_name(minigame.name)]
+        del plg._minigames_by_class[(minigame.module, minigame.classname)]
+        for prefix in plg._search_prefixes(minigame):
+            keys = plg._search_index[prefix]
+            keys.discard((minigame.module, minigame.classname))
+            if not keys:
+                del plg._search_index[prefix]
+        if minigame._gametype is not None:
+            for sessiontype in minigame.supported_sessiontypes:
+                plg._metadata.pop((minigame._gametype, sessiontype), None)
+
+    def _find_minigame(module: str, classname: str) -> plg.Minigame | None:
+        """ Called to get listed minigame of a gametype, if any. """
+        return plg._minigames_by_class.get((module, classname))
+
+    def _get_metadata(
+        gametype: type[bs.GameActivity], sessiontype: type[bs.Session]
+    ) -> dict[str, Any]:
+        """ Called to get (cached) settings, maps and description of a gametype. """
+
+        metadata = plg._metadata.get((gametype, sessiontype))
+        if metadata is None:
+            metadata = {
+                "settings": gametype.get_available_settings(sessiontype),
+                "maps": gametype.get_supported_maps(sessiontype),
+                "description": gametype.get_description_display_string(sessiontype),
+            }
+            plg._metadata[(gametype, sessiontype)] = metadata
+        return metadata
+
+    def _prefetch_metadata(minigames: list[plg.Minigame]) -> None:
+        """ Called in bg thread to fill metadata of given minigames. """
+
+        for minigame in minigames:
+            try:
+                for sessiontype in minigame.supported_sessiontypes:
+                    plg._get_metadata(minigame.gametype, sessiontype)
+            except Exception:
+                logging.exception(
+                    "Error getting metadata of '%s.%s'.",
+                    minigame.module, minigame.classname)
+
+    def _queue_prefetch(minigames: list[plg.Minigame]) -> None:
+        """ Called to prefetch metadata in our bg worker; started on first use. """
+
+        plg._prefetch_queue.put(minigames)
+        if plg._prefetch_thread is None:
+            plg._prefetch_thread = Thread(target=plg._prefetch_worker, daemon=True)
+            plg._prefetch_thread.start()
+
+    def _prefetch_worker() -> None:
+        """ Called in bg thread to prefetch queued minigames, one batch at a time. """
+        while True:
+            plg._prefetch_metadata(plg._prefetch_queue.get())
+
+    def _search_words(text: str) -> list[str]:
+        return re.findall(r"[^\W_]+", text.lower())
+
+    def _search_prefixes(minigame: plg.Minigame) -> set[str]:
+        """ Called to get all searchable prefixes of a minigame. """
+
+        words = plg._search_words(
+            f"{minigame.name} {minigame.module} {minigame.description}")
+        return {
+            word[:end] for word in words
+            for end in range(1, len(word)+1)
+        }
+
+    def _search_keys(query: str) -> set[tuple[str, str]] | None:
+        """ Called to get keys of minigames matching all words of query.
+
+        None if query has no words (means everything matches).
+        """
+        keys: set[tuple[str, str]] | None = None
+        for word in plg._search_words(query):
+            matches = plg._search_index.get(word, set())
+            keys = matches.copy() if keys is None else keys & matches
+            if not keys:
+                break
+        return keys
                 
+    def _preload_game_media() -> None:
+        """ Called in join lobby to load media of the selected game's map and actors. """
+
+        from bascenev1lib.actor.spazfactory import SpazFactory
+        from bascenev1lib.actor.bomb import BombFactory
+        from bascenev1lib.actor.powerupbox import PowerupBoxFactory
+
+        # Disable it to compare start times against no preloading.
+        if not bui.app.config.get("Quick Play Preload", True):
+            return
+
+        try:
+            maptype = bs.get_map_class(plg._game_spec["settings"]["map"])
+            plg._preloads = [
+                maptype.on_preload(),
+                # Almost every minigame uses these.
+                SpazFactory.get(),
+                BombFactory.get(),
+                PowerupBoxFactory.get(),
+            ]
+        except Exception:
+            logging.exception("Error preloading quick play media.")
+
+    def _start_game(session: bs.MultiTeamSession) -> None:
+        """ Called to make and set our selected game activity in the session. """
+
+        start_time = time.perf_counter()
+
+        gametype = plg._game_spec["type"]
+        game_settings = plg._game_spec["settings"].copy()
+        game_activity = bs.newactivity(gametype, game_settings)
+        
+        # hmm... eric code.
+        # (Re)register all players and wire stats to our next activity.
+        for player in session.sessionplayers:
+            # ..but only ones who have been placed on a team
+            # (ie: no longer sitting in the lobby).
+            try:
+                has_team = player.sessionteam is not None
+            except bs.NotFoundError:
+                has_team = False
+            if has_team:
+                session.stats.register_sessionplayer(player)
+
+        session.stats.setactivity(game_activity)
+        # Now flip the current activity.
+        session.setactivity(game_activity)
+
+        # Game has its own references now.
+        preloaded = bool(plg._preloads)
+        plg._preloads = []
+        start_ms = (time.perf_counter() - start_time) * 1000.0
+        logging.info(
+            "Quick play: '%s' took %.1f ms to start (preloaded: %s).",
+            gametype.name, start_ms, preloaded,
+        )
+        if plg._soak is not None:
+            plg._soak_game_started(game_activity, start_ms)
+
+    def _start_next_queued(session: bs.MultiTeamSession) -> bool:
+        """ Called to start next queued game; False if queue is empty. """
+
+        while plg._game_queue:
+            plg._game_spec = plg._game_queue.pop(0)
+            # Can't play it in this session; like a FFA game in teams.
+            sessiontype = plg._game_spec.get("sessiontype")
+            if sessiontype is not None and not isinstance(session, sessiontype):
+                logging.warning(
+                    "Skipping queued quick play game '%s'; it's for %s.",
+                    plg._game_spec["type"], sessiontype.__name__,
+                )
+                continue
+            try:
+                plg._start_game(session)
+                return True
+            except Exception as exc:
+                # Broken game; let's skip to next one.
+                logging.exception(
+                    "Error starting quick play game '%s'.", plg._game_spec["type"])
+                if plg._soak is not None:
+                    plg._soak["results"].append({
+                        "gametype": plg._classpath(plg._game_spec["type"]),
+                        "error": repr(exc),
+                    })
+        return False
+
+    def _classpath(gametype: type[bs.GameActivity]) -> str:
+        """ Called to get 'module.ClassName' of a gametype. """
+        return f"{gametype.__module__}.{gametype.__name__}"
+
+    def soak_test(
+        sessiontype: str | type[bs.Session] = "FreeForAllSession",
+        player_count: int = 4,
+        round_duration: float = 60.0,
+    ) -> None:
+        """ Play every custom minigame back to back with bot players.
+
+        Start latency, node counts at begin and end, and python memory
+        growth of each game is written to our soak report in cache directory.
+        """
+        if isinstance(sessiontype, str):
+            sessiontype = plg._sessiontype_from_name(sessiontype)
+        specs: list[dict[str, Any]] = []
+        for minigame in plg.custom_minigames:
+            if sessiontype not in minigame.supported_sessiontypes:
+                continue
+            try:
+                gametype = minigame.gametype
+                settings = plg._default_settings(gametype, sessiontype)
+            except Exception:
+                logging.exception(
+                    "Error preparing '%s.%s' for soak test.",
+                    minigame.module, minigame.classname)
+                continue
+            specs.append({"type": gametype, "settings": settings})
+        if not specs:
+            bui.screenmessage(bui.Lstr(value="No minigames to soak test!"))
+            return
+
+        plg._game_spec = specs[0]
+        plg._game_queue = specs[1:]
+        plg._host_session(sessiontype)
+        if not plg.quick_play:
+            return # couldn't host.
+
+        # After hosting; a new session tears down any running soak test.
+        plg._soak = {"round_duration": round_duration, "results": []}
+        tracemalloc.start()
+        # Fake input devices which join and play like players.
+        bs.set_stress_testing(True, player_count)
+
+    def _soak_game_started(game_activity: bs.GameActivity, start_ms: float) -> None:
+        """ Called when a soak test game is set. """
+
+        assert plg._soak is not None
+        result: dict[str, Any] = {
+            "gametype": plg._classpath(type(game_activity)),
+            "start_ms": round(start_ms, 2),
+            "nodes_begin": None,
+            "nodes_end": None,
+            "memory_begin": tracemalloc.get_traced_memory()[0],
+            "memory_growth": None,
+        }
+        plg._soak["results"].append(result)
+        with game_activity.context:
+            # Settled a bit by then.
+            bs.timer(1.0, bui.Call(plg._soak_count_nodes, result, "nodes_begin"))
+            bs.timer(
+                plg._soak["round_duration"],
+                bui.Call(plg._soak_time_up, weakref.ref(game_activity)),
+            )
+
+    def _soak_count_nodes(result: dict[str, Any], key: str) -> None:
+        """ Called in a game's context to note its node count. """
+        result[key] = len(bs.getnodes())
+
+    def _soak_time_up(activity_ref: weakref.ref[bs.GameActivity]) -> None:
+        """ Called to end a soak test game which is taking too long. """
+
+        activity = activity_ref()
+        if activity is None or activity.has_ended():
+            return
+        try:
+            activity.end_game()
+        except Exception:
+            activity.end(bs.GameResults(), force=True)
+
+    def _soak_game_ended(game_activity: bs.GameActivity) -> None:
+        """ Called when a soak test game ends. """
+
+        assert plg._soak is not None
+        if not plg._soak["results"]:
+            return
+        result = plg._soak["results"][-1]
+        if result.get("gametype") != plg._classpath(type(game_activity)):
+            return
+        with game_activity.context:
+            plg._soak_count_nodes(result, "nodes_end")
+        result["memory_growth"] = (
+            tracemalloc.get_traced_memory()[0] - result.pop("memory_begin"))
+        plg._write_soak_report() # incase we crash in next one.
+
+    def _stop_soak() -> None:
+        """ Called to end soak test; its bots, memory tracing and all. """
+
+        bs.set_stress_testing(False, 0)
+        tracemalloc.stop()
+        plg._write_soak_report()
+        plg._soak = None
+
+    def _finish_soak() -> None:
+        """ Called when all soak test games are played. """
+
+        plg._stop_soak()
+        # Next playlist session user starts isn't ours.
+        plg._reset_quick_play()
+        bui.screenmessage(bui.Lstr(value="Soak test done!"), color=(0.0, 0.8, 0.4))
+
+    def _write_soak_report() -> None:
+        """ Called to write soak test results so far. """
+        assert plg._soak is not None
+        path = os.path.join(bui.app.env.cache_directory, plg._SOAK_REPORT_FILE_NAME)
+        try:
+            with open(path, "w", encoding="utf-8") as outfile:
+                json.dump(plg._soak["results"], outfile, indent=2)
+        except OSError:
+            logging.exception("Error writing quick play soak report '%s'.", path)
+
     def _completion_call(
         minigame: plg.Minigame, 
         config: dict[str, Any], 
-        from_window: bui.MainWindow
+        from_window: bui.MainWindow,
+        queue: bool = False,
     ) -> None:
-        """ Called when a user press back or play btn of PlaylistEditGameWindow emit from minigame 'play' btn. """
+        """ Called when a user press back or play btn of PlaylistEditGameWindow emit from minigame 'play' or 'queue' btn. """
 
         # no-op if we're not in control.
         if not from_window.main_window_has_control():
@@ -130,6 +1073,20 @@ class plg(bs.Plugin):
             from_window.main_window_back()
             plg._editwindow_back_state = None # reset.
 
+        elif queue: # They want to play it later.
+            plg._game_queue.append({
+                "type": minigame.gametype,
+                "settings": config["settings"].copy(),
+                "sessiontype": minigame.selected_sessiontype,
+            })
+            bui.screenmessage(
+                bui.Lstr(value=f"Added to queue ({len(plg._game_queue)})."),
+                color=(0.0, 0.8, 0.4),
+            )
+            # head back the our SettingsWindow to pick more.
+            from_window.main_window_back()
+            plg._editwindow_back_state = None # reset.
+
         else: # Else They press the 'Play' Button.
             
             # close the winodow.
@@ -140,22 +1097,155 @@ class plg(bs.Plugin):
             bui.app.classic.saved_ui_state = copy(plg._editwindow_back_state)
             plg._editwindow_back_state = None # reset.
 
-            plg._game_spec["type"] = minigame.gametype
-            plg._game_spec["settings"] = config["settings"].copy()
+            plg._game_spec = {
+                "type": minigame.gametype,
+                "settings": config["settings"].copy(),
+            }
+            # Just this one game; not the queued ones after it.
+            plg._game_queue.clear()
+            plg._add_recent(minigame, config["settings"])
+            plg._host_session(minigame.selected_sessiontype)
+
+    def _add_recent(minigame: plg.Minigame, settings: dict[str, Any]) -> None:
+        """ Called to remember a launched game, so it can be replayed in one tap. """
+
+        entry = {
+            "gametype": f"{minigame.module}.{minigame.classname}",
+            "name": minigame.name,
+            "sessiontype": minigame.selected_sessiontype.__name__,
+            "settings": settings.copy(),
+        }
+        cfg = bui.app.config
+        recent = [
+            old_entry for old_entry in cfg.get("Quick Play Recent", [])
+            if old_entry != entry
+        ]
+        cfg["Quick Play Recent"] = [entry] + recent[:plg._RECENT_MAX-1]
+        cfg.commit()
+
+    def _host_session(sessiontype: type[bs.Session]) -> None:
+        """ Called to host a session for our quick play. """
+
+        # Not a left over quick play session ending; ours is starting.
+        plg.quick_play = False
+        # Attempt to host selected sessiontype..
+        try:
+            bs.new_host_session(sessiontype)
+            plg.quick_play = True # set.
+        except Exception:            
+            # Else drop back into a main menu session.
+            plg._game_queue.clear()
+            bs.new_host_session(mainmenu.MainMenuSession)
+
+    def host_game(
+        gametype: str | type[bs.GameActivity],
+        sessiontype: str | type[bs.Session],
+        settings: dict[str, Any] | None = None,
+    ) -> None:
+        """ Host a quick play game without any UI.
+
+        gametype can be a class or its 'module.ClassName' path, and
+        sessiontype a class or its name. Settings which are not given
+        get the gametype's defaults. Handy from server console too.
+        Quick play goes off on its own once this session ends.
+        """
+        if isinstance(gametype, str):
+            module, _, classname = gametype.rpartition(".")
+            gametype = getattr(importlib.import_module(module), classname)
+        if isinstance(sessiontype, str):
+            sessiontype = plg._sessiontype_from_name(sessiontype)
+        if not gametype.supports_session_type(sessiontype):
+            raise ValueError(
+                f"'{plg._classpath(gametype)}' doesn't support {sessiontype.__name__}.")
+
+        game_settings = plg._default_settings(gametype, sessiontype)
+        game_settings.update(settings or {})
+
+        plg._game_spec = {"type": gametype, "settings": game_settings}
+        plg._host_session(sessiontype)
+
+    def _sessiontype_from_name(name: str) -> type[bs.Session]:
+        """ Called to get our sessiontype by its name; 'FreeForAll' works too. """
+        for sessiontype in plg.sessiontypes:
+            if name in (sessiontype.__name__, sessiontype.__name__[:-7]):
+                return sessiontype
+        raise ValueError(
+            f"Unknown sessiontype '{name}'; use one of: "
+            + ", ".join(sessiontype.__name__ for sessiontype in plg.sessiontypes)
+        )
 
-            # Attempt to host selected sessiontype..
+    def _reset_quick_play() -> None:
+        """ Called when our quick play session is done; back to normal sessions. """
+        plg.quick_play = False
+        plg._game_spec = {}
+        plg._game_queue.clear()
+        # Cancelled in lobby? then nobody will take these.
+        plg._preloads = []
+
+    def _default_settings(
+        gametype: type[bs.GameActivity], sessiontype: type[bs.Session]
+    ) -> dict[str, Any]:
+        """ Called to get default settings(and first supported map) of a gametype. """
+
+        settings: dict[str, Any] = {
+            setting.name: setting.default
+            for setting in gametype.get_available_settings(sessiontype)
+        }
+        settings["map"] = gametype.get_supported_maps(sessiontype)[0]
+        return settings
+
+    def _read_server_config() -> dict[str, Any] | None:
+        """ Called to read our headless quick play config, if there's one. """
+
+        path = os.environ.get("QUICK_PLAY_CONFIG") or os.path.join(
+            bui.app.env.config_directory, plg._SERVER_CONFIG_FILE_NAME)
+        try:
+            with open(path, encoding="utf-8") as infile:
+                return json.load(infile)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            logging.exception("Error reading quick play config '%s'.", path)
+            return None
+
+    def _setup_headless() -> None:
+        """ Called on headless builds to host the game of our config. """
+
+        config = plg._read_server_config()
+        if config is None:
+            return
+        call = bui.Call(
+            plg.host_game,
+            config["gametype"],
+            config.get("sessiontype", "DualTeamSession"),
+            config.get("settings"),
+        )
+
+        server = bui.app.classic.server
+        if server is None:
+            bui.pushcall(call)
+            return
+
+        # The server launches its playlist session on its own time
+        # (and again after each session ends); let's launch ours instead.
+        def _launch_server_session() -> None:
             try:
-                sessiontype = minigame.selected_sessiontype
-                bs.new_host_session(sessiontype)
-                plg.quick_play = True # set.
-            except Exception:            
-                # Else drop back into a main menu session.
-                bs.new_host_session(mainmenu.MainMenuSession)
+                call()
+            except Exception:
+                logging.exception("Error hosting quick play server game.")
+                original()
+
+        original = server._launch_server_session
+        server._launch_server_session = _launch_server_session
 
 
 class SettingsWindow(bui.MainWindow):
     """ Settings Window for our plugin """
 
+    # Max minigame rows we create; those are recycled while paging.
+    # so our window opens in same time whatever the minigames count is.
+    _ROWS_PER_PAGE: int = 10
+
     def __init__(
         self,
         transition: str = "in_right",
@@ -188,15 +1278,32 @@ class SettingsWindow(bui.MainWindow):
         # The covered space info from up to down.
         # It will be helpful in ui drawing.
         self._covered_space: float = 0.0 
+
+        # The minigames to show and index of first one in our rows.
+        self._minigames: list[plg.Minigame] = plg.custom_minigames
+        self._first_index: int = 0
+        # Our recycled (name text, sessiontype btn, play btn, queue btn) rows.
+        self._rows: list[tuple[bui.Widget, bui.Widget, bui.Widget, bui.Widget]] = []
+        self._page_text: bui.Widget | None = None
+        self._page_btns: tuple[bui.Widget, bui.Widget] | None = None
+        self._search_field: bui.Widget | None = None
+        self._search_query: str = ""
+        self._search_timer: bui.AppTimer | None = None
+        self._scroll_container: bui.Widget | None = None
+        self._empty_text: bui.Widget | None = None
+        self._row_capacity: int = 0
         
         # Elements drawing.
         self.draw_head(uiscale)
         self.draw_body(uiscale)
+        self.draw_foot(uiscale)
     
     def draw_head(self, uiscale: bui.UIScale) -> None:
     
         self._draw_head_btns(uiscale)
         self._draw_title_text(uiscale) 
+        if plg.custom_minigames:
+            self._draw_search_field(uiscale)
 
     def _draw_head_btns(self, uiscale: bui.UIScale) -> None:
         """ back button UI """  
@@ -228,6 +1335,45 @@ class SettingsWindow(bui.MainWindow):
                 edit=self._root_widget, cancel_button=self._back_btn
             )
         self._covered_space = self.height - y_pos 
+
+        # recent button next to back button.
+        recent_width = 100.0
+        self._recent_btn = bui.buttonwidget(
+            parent=self._root_widget,
+            position=(
+                x_pos + (0.0 if self._back_btn is None else 60.0), y_pos),
+            size=(recent_width, 40.0),
+            label=bui.Lstr(value="Recent"),
+            color=(0.5, 0.4, 0.7),
+            autoselect=True,
+        )
+        bui.buttonwidget(
+            edit=self._recent_btn,
+            on_activate_call=bui.Call(self._show_recent, self._recent_btn),
+        )
+
+        # queue buttons at right side.
+        clear_width = 70.0
+        queue_width = 140.0
+        self._clear_queue_btn = bui.buttonwidget(
+            parent=self._root_widget,
+            position=(self.width-x_pad-clear_width, y_pos),
+            size=(clear_width, 40.0),
+            label=bui.Lstr(value="Clear"),
+            color=(0.6, 0.3, 0.3),
+            autoselect=True,
+            on_activate_call=self._clear_queue,
+        )
+        self._play_queue_btn = bui.buttonwidget(
+            parent=self._root_widget,
+            position=(self.width-x_pad-clear_width-queue_width-10.0, y_pos),
+            size=(queue_width, 40.0),
+            label="",
+            color=(0.0, 0.8, 0.4),
+            autoselect=True,
+            on_activate_call=self._play_queue,
+        )
+        self._update_queue_btn()
     
     def _draw_title_text(self, uiscale: bui.UIScale) -> None:
         """ Title text UI """
@@ -243,6 +1389,32 @@ class SettingsWindow(bui.MainWindow):
         	color=(1.0, 1.0, 1.0, 0.7),
         	h_align="center", 
         )
+
+    def _draw_search_field(self, uiscale: bui.UIScale) -> None:
+        """ Search text field UI """
+
+        width = self.width * (0.75 if uiscale is bui.UIScale.SMALL else 0.85)
+        height = 40.0
+        y_pos = self.height - self._covered_space - height - 5.0
+
+        self._search_field = bui.textwidget(
+            parent=self._root_widget,
+            position=((self.width-width)/2, y_pos),
+            size=(width, height),
+            text="",
+            editable=True,
+            description="Search",
+            h_align="left",
+            v_align="center",
+            max_chars=50,
+            maxwidth=width-20.0,
+            autoselect=True,
+            up_widget=self._back_btn,
+        )
+        # Text widgets don't tell us about typing; so let's peek at it.
+        self._search_timer = bui.AppTimer(
+            0.15, bui.WeakCall(self._check_search), repeat=True)
+        self._covered_space += height + 10.0
         
     def draw_body(self, uiscale: bui.UIScale) -> None:  
         """ scroll widget """
@@ -273,12 +1445,13 @@ class SettingsWindow(bui.MainWindow):
             edit=self._root_widget, selected_child=self._scrollwidget)  
 
         self._covered_space += _scrollheight
+        self._scrollwidth = _scrollwidth
 
         if plg.custom_minigames:
             self._draw_scroll_body(_scrollwidth)
         else:
             # No minigames found text.
-            bui.textwidget(
+            self._empty_text = bui.textwidget(
                 parent=self._root_widget,
                 size=(0.0, 0.0),
                 position=(self.width/2, self.height/2),
@@ -292,93 +1465,312 @@ class SettingsWindow(bui.MainWindow):
                 selected_child=self._back_btn,
             )
 
+    def draw_foot(self, uiscale: bui.UIScale) -> None:
+        """ Option checkboxes UI """
+
+        y_pos = 50.0 if uiscale is bui.UIScale.SMALL else 15.0
+        width = 200.0
+        # (config key, text, default)
+        options = [
+            ("Quick Play Rematch", "Play again after game", False),
+            ("Quick Play Fast Exit", "Skip winner screen", False),
+            ("Quick Play Auto Join", "Auto join lobby", True),
+        ]
+
+        x_pos = self.width/2 - (width+10.0) * len(options)/2
+        for key, text, default in options:
+            bui.checkboxwidget(
+                parent=self._root_widget,
+                position=(x_pos, y_pos),
+                size=(width, 30.0),
+                text=bui.Lstr(value=text),
+                value=bool(bui.app.config.get(key, default)),
+                maxwidth=width-40.0,
+                autoselect=True,
+                on_value_change_call=bui.Call(self._set_option, key),
+            )
+            x_pos += width + 10.0
+
+    def _set_option(self, key: str, value: bool) -> None:
+        """ Called when an option checkbox is toggled. """
+        cfg = bui.app.config
+        cfg[key] = value
+        cfg.apply_and_commit()
+
     def _draw_scroll_body(self, sub_width: float) -> None:
         """ sub-container UI """
 
-        line_height = 50.0
-        sub_height = (len(plg.custom_minigames)+1) * line_height
+        self._line_height = 50.0
+        row_count = min(len(self._minigames), self._ROWS_PER_PAGE)
+        paged = len(self._minigames) > row_count
+        sub_height = (row_count+1) * self._line_height
 
-        _scroll_container = bui.containerwidget(
+        self._scroll_container = bui.containerwidget(
         	parent=self._scrollwidget,
         	background=False,
         	size=(sub_width, sub_height),
         )   
-       
-        _height = line_height - 20.0
-        _xpos = sub_width * 0.63
-        _line_center = line_height/2 - _height/2
+        self._sub_width = sub_width
+        self._sub_height = sub_height
+        self._row_capacity = row_count
 
-        top_y = sub_height - line_height
-        for minigame in plg.custom_minigames:
+        if paged:
+            self._draw_page_btns()
+        self._set_row_count(row_count)
+        self._fill_rows()
+
+    def _set_row_count(self, row_count: int) -> None:
+        """ Called to create or delete our rows, so we've exactly 'row_count' rows. """
+
+        # no-op if we've already.
+        if row_count == len(self._rows):
+            return
+
+        while len(self._rows) > row_count:
+            for widget in self._rows.pop():
+                widget.delete()
+
+        _height = self._line_height - 20.0
+        _xpos = self._sub_width * 0.55
+        _line_center = self._line_height/2 - _height/2
+
+        while len(self._rows) < row_count:
+            top_y = self._sub_height - (len(self._rows)+1) * self._line_height
             # minigame name text.
             gametext = bui.textwidget(
-                parent=_scroll_container,
+                parent=self._scroll_container,
                 position=(15.0, top_y-_line_center),
                 size=(_xpos, _height),
                 v_align="center",
-                text=minigame.gametype.get_display_string(),
+                text="",
                 maxwidth=_xpos,
                 selectable=True,
                 click_activate=True,
                 autoselect=True,
             )
-            bui.textwidget(
-                edit=gametext,
-                on_activate_call=bui.Call(self._show_game_desc, minigame, gametext),
-            )
             # sessiontype button.
             sbtn = bui.buttonwidget(
-                parent=_scroll_container,
+                parent=self._scroll_container,
                 size=(100, _height),
                 position=(_xpos, top_y-_line_center),
-                label=bui.Lstr(
-                    value=minigame.selected_sessiontype.__name__[:-7]),
+                label="",
                 color=(0.6, 0.3, 0.1),
                 autoselect=True,
             )
-            bui.buttonwidget(
-                edit=sbtn,
-                on_activate_call=bui.Call(self._show_sessiontypes, minigame, sbtn),
-            )
             # Play button.
-            bui.buttonwidget(
-                parent=_scroll_container,
+            pbtn = bui.buttonwidget(
+                parent=self._scroll_container,
                 size=(70, _height),
                 position=(_xpos+120, top_y-_line_center),
                 label=bui.Lstr(resource="playText"),
                 color=(0.0, 0.8, 0.4),
                 autoselect=True,
-                on_activate_call=bui.Call(self._show_edit_game, minigame),
             )
-            top_y -= line_height
-
-        children = _scroll_container.get_children()
-        # keybaord navs.
-        # left to right and right to left.
-        for i in range(0, len(children), 3):
-            bui.widget(
-                edit=children[i],
-                left_widget=children[i+2]
+            # Add to queue button.
+            qbtn = bui.buttonwidget(
+                parent=self._scroll_container,
+                size=(40, _height),
+                position=(_xpos+200, top_y-_line_center),
+                label="+",
+                color=(0.3, 0.5, 0.8),
+                autoselect=True,
+            )
+            self._rows.append((gametext, sbtn, pbtn, qbtn))
+
+        self._wire_rows()
+
+    def _wire_rows(self) -> None:
+        """ keybaord navs of our rows. """
+
+        up_widget = self._search_field or self._back_btn
+        if self._search_field is not None:
+            first_row = self._rows[0][0] if self._rows else self._scrollwidget
+            bui.textwidget(edit=self._search_field, down_widget=first_row)
+        if not self._rows:
+            return
+
+        for i, row in enumerate(self._rows):
+            # left to right and right to left.
+            bui.widget(edit=row[0], left_widget=row[-1])
+            bui.widget(edit=row[-1], right_widget=row[0])
+            # top to bottum and bottum to top.
+            below = self._rows[(i+1) % len(self._rows)]
+            for widget, below_widget in zip(row, below):
+                bui.widget(edit=widget, down_widget=below_widget)
+                bui.widget(edit=below_widget, up_widget=widget)
+        # Allow getting back to the search field or back button.
+        bui.widget(
+            edit=self._rows[0][0],
+            up_widget=up_widget
+        )
+
+        # last row <-> page buttons.
+        if self._page_btns is not None:
+            prev_btn, next_btn = self._page_btns
+            last_row = self._rows[-1]
+            bui.widget(edit=prev_btn, up_widget=last_row[0])
+            bui.widget(edit=next_btn, up_widget=last_row[-1])
+            bui.widget(edit=last_row[0], down_widget=prev_btn)
+            for widget in last_row[1:]:
+                bui.widget(edit=widget, down_widget=next_btn)
+
+    def _draw_page_btns(self) -> None:
+        """ Previous/Next page buttons UI """
+
+        height = self._line_height - 20.0
+        y_pos = self._line_height/2 - height/2
+
+        prev_btn = bui.buttonwidget(
+            parent=self._scroll_container,
+            size=(70, height),
+            position=(15.0, y_pos),
+            label=bui.charstr(bui.SpecialChar.LEFT_ARROW),
+            color=(0.5, 0.5, 0.6),
+            autoselect=True,
+            on_activate_call=bui.Call(self._change_page, -1),
+        )
+        self._page_text = bui.textwidget(
+            parent=self._scroll_container,
+            size=(0, 0),
+            position=(self._sub_width/2, y_pos+height/2),
+            h_align="center",
+            v_align="center",
+            text="",
+            color=(0.6, 0.6, 0.6),
+        )
+        next_btn = bui.buttonwidget(
+            parent=self._scroll_container,
+            size=(70, height),
+            position=(self._sub_width-85.0, y_pos),
+            label=bui.charstr(bui.SpecialChar.RIGHT_ARROW),
+            color=(0.5, 0.5, 0.6),
+            autoselect=True,
+            on_activate_call=bui.Call(self._change_page, 1),
+        )
+        bui.widget(edit=prev_btn, right_widget=next_btn)
+        bui.widget(edit=next_btn, left_widget=prev_btn)
+        self._page_btns = (prev_btn, next_btn)
+
+    def _change_page(self, step: int) -> None:
+        """ Called to show previous(-1) or next(1) page of minigames. """
+
+        first_index = self._first_index + step * self._ROWS_PER_PAGE
+        self._first_index = max(0, min(first_index, self._last_page_index()))
+        self._fill_rows()
+
+    def _last_page_index(self) -> int:
+        """ Called to get first index of last page; pages start on multiples of page size. """
+        return max(0, len(self._minigames) - 1) // self._ROWS_PER_PAGE * self._ROWS_PER_PAGE
+
+    def _fill_rows(self) -> None:
+        """ Called to (re)fill our recycled rows with minigames of current page. """
+
+        minigames = self._minigames[self._first_index:]
+        # Last page may have fewer minigames.
+        self._set_row_count(min(len(minigames), self._row_capacity))
+        for (gametext, sbtn, pbtn, qbtn), minigame in zip(self._rows, minigames):
+            bui.textwidget(
+                edit=gametext,
+                text=minigame.get_display_string(),
+                on_activate_call=bui.Call(self._show_game_desc, minigame, gametext),
+            )
+            bui.buttonwidget(
+                edit=sbtn,
+                label=bui.Lstr(
+                    value=minigame.selected_sessiontype.__name__[:-7]),
+                on_activate_call=bui.Call(self._show_sessiontypes, minigame, sbtn),
             )
-            bui.widget(
-                edit=children[i+2],
-                right_widget=children[i]
+            bui.buttonwidget(
+                edit=pbtn,
+                on_activate_call=bui.Call(self._show_edit_game, minigame),
             )
-        # top to bottum and bottum to top.
-        for i in range(-1, -4, -1):
-            bui.widget(
-                edit=children[i],
-                down_widget=children[i+3]
+            bui.buttonwidget(
+                edit=qbtn,
+                on_activate_call=bui.Call(self._show_edit_game, minigame, True),
             )
-            bui.widget(
-                edit=children[i+3],
-                up_widget=children[i]
+
+        # Let's have metadata of the shown minigames ready before user clicks.
+        # (Not imported ones are imported only when they're played.)
+        unfetched = [
+            minigame for minigame in minigames[:len(self._rows)]
+            if minigame._gametype is not None and any(
+                (minigame._gametype, sessiontype) not in plg._metadata
+                for sessiontype in minigame.supported_sessiontypes)
+        ]
+        if unfetched:
+            plg._queue_prefetch(unfetched)
+
+        if self._page_text is not None:
+            last_index = min(self._first_index+len(self._rows), len(self._minigames))
+            bui.textwidget(
+                edit=self._page_text,
+                text=(
+                    f"{self._first_index+1}-{last_index} / {len(self._minigames)}"
+                    if self._minigames else "0 / 0"
+                ),
             )
-        # Allow getting back to the back button.
-        bui.widget(
-            edit=children[0],
-            up_widget=self._back_btn
-        )
+
+    def _check_search(self) -> None:
+        """ Called time to time to filter minigames if search query has changed. """
+
+        if self._search_field is None or not self._search_field:
+            return
+        query = cast(str, bui.textwidget(query=self._search_field)).strip().lower()
+        if query == self._search_query:
+            return
+
+        # When user types more, narrow down the current results only.
+        narrow = bool(self._search_query) and query.startswith(self._search_query)
+        self._search_query = query
+        self._show_minigames(self._filter_minigames(query, narrow))
+
+    def _filter_minigames(
+        self, query: str, narrow: bool = False
+    ) -> list[plg.Minigame]:
+        """ Called to get minigames matching the search query. """
+
+        keys = plg._search_keys(query)
+        if keys is None:
+            return plg.custom_minigames
+        candidates = self._minigames if narrow else plg.custom_minigames
+        return [
+            minigame for minigame in candidates
+            if (minigame.module, minigame.classname) in keys
+        ]
+
+    def _show_minigames(self, minigames: list[plg.Minigame]) -> None:
+        """ Called to show given minigames in our rows from first page. """
+
+        self._minigames = minigames
+        self._first_index = 0
+        # Rows are only created upto what we drew at first.
+        self._set_row_count(min(len(minigames), self._row_capacity))
+        self._fill_rows()
+
+    def refresh_minigames(self) -> None:
+        """ Called when our listed custom minigames have changed. """
+
+        minigames = self._filter_minigames(self._search_query)
+        # Need more rows than our container has? let's draw it again.
+        if self._row_capacity < min(len(minigames), self._ROWS_PER_PAGE):
+            if self._scroll_container is not None:
+                self._scroll_container.delete()
+            if self._empty_text is not None:
+                self._empty_text.delete()
+                self._empty_text = None
+            self._rows = []
+            self._page_text = None
+            self._page_btns = None
+            self._minigames = minigames
+            self._first_index = 0
+            self._draw_scroll_body(self._scrollwidth)
+            return
+
+        first_index = self._first_index
+        self._show_minigames(minigames)
+        # Stay on same page if we can.
+        self._first_index = min(first_index, self._last_page_index())
+        self._fill_rows()
     
     def _show_game_desc(
         self, minigame: plg.Minigame, origin_text: bui.Widget
@@ -392,7 +1784,7 @@ class SettingsWindow(bui.MainWindow):
         """ Called to show/select minigame supported sessiontypes. """
         _PopupMenuWindow(origin_button=btn, minigame=minigame)
     
-    def _show_edit_game(self, minigame: plg.Minigame) -> None:
+    def _show_edit_game(self, minigame: plg.Minigame, queue: bool = False) -> None:
         """ Called to show minigame edit options. """
 
         from bauiv1lib.playlist.editgame import PlaylistEditGameWindow
@@ -401,21 +1793,136 @@ class SettingsWindow(bui.MainWindow):
         if not self.main_window_has_control():
             return
 
+        # All queued games are played in one session.
+        if queue and plg._game_queue and (
+            plg._game_queue[0]["sessiontype"] is not minigame.selected_sessiontype
+        ):
+            bui.screenmessage(
+                bui.Lstr(value=(
+                    "Queue is for "
+                    f"{plg._game_queue[0]['sessiontype'].__name__[:-7]} games!"
+                )),
+                color=(1.0, 0.3, 0.3),
+            )
+            bui.getsound("error").play()
+            return
+
+        # Listed from its source; first time we import it is here.
+        try:
+            gametype = minigame.gametype
+            metadata = plg._get_metadata(gametype, minigame.selected_sessiontype)
+        except Exception as exc:
+            logging.exception(
+                "Error loading minigame '%s.%s'.", minigame.module, minigame.classname)
+            bui.screenmessage(bui.Lstr(value="Can't load that game!"), color=(1.0, 0.3, 0.3))
+            bui.getsound("error").play()
+            # Broken mod; don't list it anymore this run.
+            plg._quarantined[minigame.module] = f"error: {exc!r}"
+            for broken in [
+                mg for mg in plg.custom_minigames if mg.module == minigame.module
+            ]:
+                plg._remove_minigame(broken)
+            self.refresh_minigames()
+            return
+
+        # PlaylistEditGameWindow asks gametype for these; so let's give it
+        # a throwaway subclass answering from our cache. (Don't wanna touch
+        # the mod's own class; our prefetch thread may be using it.)
+        cached_gametype = type(gametype.__name__, (gametype,), {
+            "__module__": gametype.__module__,
+            "get_available_settings": classmethod(
+                lambda cls, sessiontype: copy(metadata["settings"])),
+            "get_supported_maps": classmethod(
+                lambda cls, sessiontype: copy(metadata["maps"])),
+        })
         window = PlaylistEditGameWindow(
-            gametype=minigame.gametype,
+            gametype=cached_gametype,
             sessiontype=minigame.selected_sessiontype,
             config=None,
-            completion_call=bui.Call(plg._completion_call, minigame)
+            completion_call=bui.Call(plg._completion_call, minigame, queue=queue)
         )
 
         self.main_window_replace(window)
 
         plg._editwindow_back_state = window.main_window_back_state
-        # wnat to show 'play' text.
+        # wnat to show 'play' or 'add' text.
         bui.buttonwidget(
             edit=window._root_widget.get_children()[1],
-            label=bui.Lstr(resource="playText")
+            label=bui.Lstr(value="Add") if queue else bui.Lstr(resource="playText")
+        )
+
+    def _update_queue_btn(self) -> None:
+        """ Called to show queued games count on our queue button. """
+        bui.buttonwidget(
+            edit=self._play_queue_btn,
+            label=bui.Lstr(value=f"Play queue ({len(plg._game_queue)})"),
         )
+
+    def _clear_queue(self) -> None:
+        """ Called to remove all queued games. """
+        plg._game_queue.clear()
+        self._update_queue_btn()
+
+    def _play_queue(self) -> None:
+        """ Called to play all queued games back to back. """
+
+        # no-op if we don't have control.
+        if not self.main_window_has_control():
+            return
+        if not plg._game_queue:
+            bui.screenmessage(bui.Lstr(value="Queue is empty!"), color=(1.0, 0.3, 0.3))
+            bui.getsound("error").play()
+            return
+
+        spec = plg._game_queue.pop(0)
+        self._host_game(spec, spec["sessiontype"])
+
+    def _show_recent(self, btn: bui.Widget) -> None:
+        """ Called to show recently launched games. """
+
+        if not bui.app.config.get("Quick Play Recent"):
+            bui.screenmessage(bui.Lstr(value="No recent games!"), color=(1.0, 0.3, 0.3))
+            bui.getsound("error").play()
+            return
+        _RecentPopupWindow(origin_button=btn, settings_window=self)
+
+    def play_recent(self, entry: dict[str, Any]) -> None:
+        """ Called to launch a recent game with its saved settings. """
+
+        # no-op if we don't have control.
+        if not self.main_window_has_control():
+            return
+        try:
+            module, _, classname = entry["gametype"].rpartition(".")
+            minigame = plg._find_minigame(module, classname)
+            gametype = (
+                minigame.gametype if minigame is not None
+                else getattr(importlib.import_module(module), classname)
+            )
+            sessiontype = next(
+                st for st in plg.sessiontypes if st.__name__ == entry["sessiontype"])
+        except Exception:
+            logging.exception("Error loading recent game '%s'.", entry["gametype"])
+            bui.screenmessage(bui.Lstr(value="Can't load that game!"), color=(1.0, 0.3, 0.3))
+            bui.getsound("error").play()
+            return
+
+        # Just this one game; not the queued ones after it.
+        plg._game_queue.clear()
+        self._host_game(
+            {"type": gametype, "settings": entry["settings"].copy()}, sessiontype)
+
+    def _host_game(
+        self, spec: dict[str, Any], sessiontype: type[bs.Session]
+    ) -> None:
+        """ Called to host a game straight from our window. """
+
+        # When we'll come back from quick play want to set our window.
+        bui.app.classic.saved_ui_state = bui.app.ui_v1.save_main_window_state(self)
+        self.main_window_close(transition="out_left")
+
+        plg._game_spec = spec
+        plg._host_session(sessiontype)
        
     @override
     def get_main_window_state(self) -> bui.MainWindowState:
@@ -428,6 +1935,55 @@ class SettingsWindow(bui.MainWindow):
         )
 
 
+class _RecentPopupWindow(popup.PopupMenuWindow):
+    """ PopupMenuWindow to show and launch recently played games. """
+
+    def __init__(
+        self,
+        origin_button: bui.widget,
+        settings_window: SettingsWindow,
+    ):
+        self._settings_window = settings_window
+        self._entries: list[dict[str, Any]] = list(
+            bui.app.config.get("Quick Play Recent", []))
+
+        choices = [str(i) for i in range(len(self._entries))]
+        choices_display = [
+            bui.Lstr(
+                value="${GAME} (${SESSION})",
+                subs=[
+                    ("${GAME}", bui.Lstr(translate=("gameNames", entry["name"]))),
+                    ("${SESSION}", entry["sessiontype"].removesuffix("Session")),
+                ],
+            )
+            for entry in self._entries
+        ]
+
+        super().__init__(
+            position=origin_button.get_screen_space_center(),
+            choices=choices,
+            choices_display=choices_display,
+            current_choice=choices[0],
+            delegate=self,
+            width=300.0,
+        )
+        # Same color as button.
+        bui.containerwidget(
+            edit=self.root_widget,
+            color=(0.5, 0.4, 0.7)
+        )
+
+    def popup_menu_selected_choice(
+        self, popup_window: popup.PopupMenuWindow, choice: str
+    ) -> None:
+        """ Called when a choice is selected in the popup. """
+        del popup_window  # unused
+        self._settings_window.play_recent(self._entries[int(choice)])
+
+    def popup_menu_closing(self, popup_window: popup.PopupWindow) -> None:
+        """ Called when the popup is closing."""
+
+
 class _PopupMenuWindow(popup.PopupMenuWindow):
     """ PopupMenuWindow to show and select Available sessiontypes of a minigame. """
 
@@ -491,11 +2047,16 @@ class _ShowDiscriptionWindow(popup.PopupWindow):
         minigame: plg.Minigame
     ) -> None:
 
-        gametype = minigame.gametype
-        sessiontype = minigame.selected_sessiontype
+        # Don't wanna import the minigame just for its description;
+        # unless it makes its own.
+        if minigame._gametype is None and not minigame.dynamic:
+            description = bui.Lstr(translate=("gameDescriptions", minigame.description))
+        else:
+            description = plg._get_metadata(
+                minigame.gametype, minigame.selected_sessiontype)["description"]
         
         width = 450
-        height = 120 + 20 * gametype.description.count('\n')
+        height = 120 + 20 * minigame.description.count('\n')
 
         super().__init__(
             position=(-120.0, origin_text.get_screen_space_center()[1]),
@@ -517,7 +2078,7 @@ class _ShowDiscriptionWindow(popup.PopupWindow):
             size=(0, 0),
             position=(width/2, height-50.0),
             maxwidth=width*0.9,
-            text=gametype.get_description_display_string(sessiontype),
+            text=description,
             h_align="center",
             color=(0.3, 1.0, 0.3),
         )
@@ -550,36 +2111,75 @@ def _new_multisession_on_activity_end(func: function) -> function:
         if plg.quick_play:
             # Aahaaaa! looks like session has been successfully hosted.
             if isinstance(args[1], bs.JoinActivity):
+                logging.info(
+                    "Quick play: lobby took %.2f s (auto join: %s).",
+                    time.perf_counter() - plg._lobby_begin_time,
+                    bool(bui.app.config.get("Quick Play Auto Join", True)),
+                )
                 # here we go....
-                gametype = plg._game_spec["type"]
-                game_settings = plg._game_spec["settings"].copy()
-                game_activity = bs.newactivity(gametype, game_settings)
-                
-                # hmm... eric code.
-                # (Re)register all players and wire stats to our next activity.
-                for player in args[0].sessionplayers:
-                    # ..but only ones who have been placed on a team
-                    # (ie: no longer sitting in the lobby).
-                    try:
-                        has_team = player.sessionteam is not None
-                    except bs.NotFoundError:
-                        has_team = False
-                    if has_team:
-                        args[0].stats.register_sessionplayer(player)
-
-                args[0].stats.setactivity(game_activity)
-                # Now flip the current activity.
-                args[0].setactivity(game_activity)
+                # same as queued ones; a broken game skips to next one.
+                plg._game_queue.insert(0, plg._game_spec)
+                if not plg._start_next_queued(args[0]):
+                    bui.screenmessage(
+                        bui.Lstr(value="Can't start that game!"), color=(1.0, 0.3, 0.3))
+                    if plg._soak is not None:
+                        plg._finish_soak()
+                    args[0].end()
             
             elif isinstance(args[1], bs.TeamGameActivity):
                 # Single game single length.
                 args[0]._series_length = int(1)
                 args[0]._ffa_series_length = int(1)
 
-                winner = args[2].winnergroups[0].teams[0]
-                winner.customdata["score"] += 1
-                        
-                # for our quick play we only need to play a single game.
+                # Draws or forcefully ended games have no winner.
+                results = args[2]
+                if isinstance(results, bs.GameResults) and results.winnergroups:
+                    winner = results.winnergroups[0].teams[0]
+                    winner.customdata["score"] += 1
+
+                if plg._soak is not None:
+                    plg._soak_game_ended(args[1])
+
+                # Got queued games? play next one right here.
+                if plg._start_next_queued(args[0]):
+                    return
+
+                # Soak test doesn't need any winner screen.
+                if plg._soak is not None:
+                    plg._finish_soak()
+                    args[0].end()
+                    return
+
+                # Who won most of our games.
+                top_score = max(
+                    team.customdata["score"] for team in args[0].sessionteams)
+                top_teams = [
+                    team for team in args[0].sessionteams
+                    if team.customdata["score"] == top_score
+                ]
+                # Nobody won or it's a tie; that's a draw.
+                winner = top_teams[0] if top_score and len(top_teams) == 1 else None
+                plg.last_winner = winner.name if winner is not None else None
+
+                # Don't wanna wait for winner screen. (Nor show it for a draw.)
+                if winner is None or bui.app.config.get("Quick Play Fast Exit", False):
+                    if winner is None:
+                        bui.screenmessage(bs.Lstr(value="It's a draw!"), color=(1.0, 1.0, 0.4))
+                    else:
+                        bui.screenmessage(
+                            bs.Lstr(resource="winsText", subs=[("${NAME}", winner.name)]),
+                            color=winner.color,
+                        )
+                    if bui.app.config.get("Quick Play Rematch", False):
+                        for team in args[0].sessionteams:
+                            team.customdata["score"] = 0
+                        plg._start_game(args[0])
+                    else:
+                        # Back to main menu; where our saved window comes back.
+                        args[0].end()
+                    return
+
+                # Done with our games.
                 # So let's head to final score screen activity when game ends.
                 args[0].setactivity(
                     bs.newactivity(
@@ -589,7 +2189,13 @@ def _new_multisession_on_activity_end(func: function) -> function:
                 )
             
             elif isinstance(args[1], TeamSeriesVictoryScoreScreenActivity):
-                args[0].end() # End the sesion.
+                if bui.app.config.get("Quick Play Rematch", False):
+                    # Play again; same session, players and teams.
+                    for team in args[0].sessionteams:
+                        team.customdata["score"] = 0
+                    plg._start_game(args[0])
+                else:
+                    args[0].end() # End the sesion.
         else:
             # orignal code.
             func(*args, **kwrags)
@@ -601,36 +2207,130 @@ bs.MultiTeamSession.on_activity_end = (
     _new_multisession_on_activity_end(bs.MultiTeamSession.on_activity_end)
 )
 
+# The 'bascenev1.Session.__init__' function.
+# A new session while ours is running means ours is over (ended, quit
+# halfway or replaced); don't let its games leak into the next session.
+def _new_session_init(func: function) -> function:
+    """ Called when a session is made. """
+    def wrapper(*args, **kwrags) -> None:
+
+        # Soak test quit halfway; don't want its bots in user's sessions.
+        if plg._soak is not None:
+            plg._stop_soak()
+        if plg.quick_play:
+            plg._reset_quick_play()
+
+        # orignal code.
+        func(*args, **kwrags)
+
+    return wrapper
+
+# wrapping...
+bs.Session.__init__ = _new_session_init(bs.Session.__init__)
+
+# The 'bascenev1.JoinActivity.on_begin' function.
+# Players are busy in lobby; best time to load our game's media.
+def _new_join_on_begin(func: function) -> function:
+    """ Called when join lobby begins. """
+    def wrapper(*args, **kwrags) -> None:
+
+        # orignal code.
+        func(*args, **kwrags)
+
+        if plg.quick_play:
+            plg._lobby_begin_time = time.perf_counter()
+            plg._preload_game_media()
+
+    return wrapper
+
+# wrapping...
+bs.JoinActivity.on_begin = _new_join_on_begin(bs.JoinActivity.on_begin)
+
+# The 'bascenev1.Chooser.__init__' function.
+# When only local players are here; no need to make them pick character,
+# team and ready up one by one. Let's get them ready to play.
+def _new_chooser_init(func: function) -> function:
+    """ Called when a player joins the lobby. """
+    def wrapper(*args, **kwrags) -> None:
+
+        # orignal code.
+        func(*args, **kwrags)
+
+        if plg.quick_play and bui.app.config.get("Quick Play Auto Join", True):
+            bs.timer(plg._AUTO_JOIN_DELAY, bs.Call(_auto_ready, weakref.ref(args[0])))
+
+    return wrapper
+
+def _auto_ready(chooser_ref: weakref.ref[bs.Chooser]) -> None:
+    """ Called to ready a lobby player if everyone in lobby is local. """
+
+    # Left or lobby is done already?
+    chooser = chooser_ref()
+    if chooser is None:
+        return
+    try:
+        choosers = chooser.lobby.get_choosers()
+    except bs.NotFoundError:
+        return
+    if chooser not in choosers or not chooser.sessionplayer.exists():
+        return
+    if chooser.ready or any(
+        lobby_chooser.sessionplayer.inputdevice.is_remote_client
+        for lobby_chooser in choosers
+    ):
+        return
+    # Team is already picked for them by lobby.
+    chooser._set_ready(True)
+
+# wrapping...
+bs.Chooser.__init__ = _new_chooser_init(bs.Chooser.__init__)
+
+# The 'bascenev1lib.actor.zoomtext.ZoomText.__init__' and 'bascenev1lib.actor.text.Text.__init__' functions.
+# Want to keep the texts which are made by our victory screen activity.
+# So we can change them directly instead of looking through all nodes.
+def _new_victory_text_init(func: function, key: str) -> function:
+    """ Called when a text actor is made. """
+    def wrapper(*args, **kwrags) -> None:
+
+        # orignal code.
+        func(*args, **kwrags)
+
+        if plg.quick_play:
+            activity = bs.getactivity(doraise=False)
+            if isinstance(activity, TeamSeriesVictoryScoreScreenActivity):
+                texts = activity.customdata.setdefault(key, [])
+                texts.append(args[0])
+                # The first text is "Press any button to play again..."
+                # Wanna show "Press any button to exit..." instead;
+                # unless user wants to play again.
+                if (
+                    key == "quick_play_texts" and len(texts) == 1
+                    and not bui.app.config.get("Quick Play Rematch", False)
+                ):
+                    args[0].node.text = "Press any button to exit..."
+
+    return wrapper
+
+# wrapping...
+ZoomText.__init__ = _new_victory_text_init(ZoomText.__init__, "quick_play_zoomtexts")
+Text.__init__ = _new_victory_text_init(Text.__init__, "quick_play_texts")
+
 # The 'bascenev1lib.activity.multiteamvictory.TeamSeriesVictoryScoreScreenActivity._show_winner' function.
 # Wanna show "'Player/Team' WINS THE GAME!" instead of "'Player/Team' WINS THE SERIES!" text.
-# also Wanna show "Press any button to exit.." instead of "Press any button to play again..." text.
 def _new_tsvssa_show_winner(func: function) -> function:
     """ Called to show our team or player winner of the game. """
     def wrapper(*args, **kwrags) -> None:
-        
+
+        zoomtexts = args[0].customdata.setdefault("quick_play_zoomtexts", [])
+        made_count = len(zoomtexts)
+
         # orignal code.
         func(*args, **kwrags)
 
-        if plg.quick_play:
-            from bascenev1lib.actor.zoomtext import ZoomText
-            from bascenev1lib.actor.text import Text
-            # _FIXME: Try to find other efficient and accurate way.. if there is. 
-            try:
-                nodes = bs.getnodes()
-                zoomtexts = [
-                    node.getdelegate(ZoomText) for node in nodes
-                    if node.getdelegate(ZoomText) is not None
-                ]
-                # prob: for other languages?
-                zoomtexts[-1].node.text = "GAME!"
-
-                texts = [
-                    node.getdelegate(Text) for node in nodes
-                    if node.getdelegate(Text) is not None
-                ]
-                texts[0].node.text = "Press any button to exit..."
-            except Exception:
-                pass
+        # The last zoomtext made by this call is the "WINS THE SERIES!" one.
+        if plg.quick_play and len(zoomtexts) > made_count:
+            # prob: for other languages?
+            zoomtexts[-1].node.text = "GAME!"
             
     return wrapper
 
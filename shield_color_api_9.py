@@ -4,6 +4,13 @@
     by shailesh_gabu_11/ShailesH
     
     Changes the shield-color same as your in-game character color.
+
+    Other palettes can be picked with "Shield Color Mode" in app config:
+        "body": character color (default).
+        "team": tint of the team color.
+        "contrast": character color, brightened/darkened to stay visible.
+        "custom": colors from "Shield Color Palette" config list
+                  (like [[1, 0, 0], [0, 0, 1]]), given to players in turn.
 """ 
 
 import bascenev1 as bs
@@ -12,18 +19,139 @@ from bascenev1lib.actor.spaz import Spaz
 # ba_meta export babase.Plugin
 class plg(bs.Plugin):
     
+    # brightness(luminance) of shields in "contrast" mode.
+    CONTRAST_LUMINANCE = 0.6
+    
+    def shield_color(mode, color, team_color, index):
+        """ Shield color of a player for the palette mode. """
+        
+        if mode == "team":
+            color = team_color
+        elif mode == "contrast":
+            luminance = 0.299 * color[0] + 0.587 * color[1] + 0.114 * color[2]
+            scale = plg.CONTRAST_LUMINANCE / max(luminance, 0.05)
+            return tuple(min(c * scale, 1.5) for c in color)
+        elif mode == "custom":
+            palette = bs.app.config.get("Shield Color Palette") or [color]
+            return tuple(palette[index % len(palette)])
+        # make it 25% darker to reduce intensity of shield light
+        return tuple(c * 0.75 for c in color)
+    
+    def build_palette(activity):
+        """ Called once when activity begins; shield color of every player. """
+        
+        mode = bs.app.config.get("Shield Color Mode", "body")
+        if mode == "body":
+            return # shields follow character color on their own.
+        
+        # all in one pass; players joining later get theirs on their equip.
+        # kept on players, so it goes away with them.
+        activity.customdata["shield_palette_mode"] = mode
+        for index, player in enumerate(activity.players):
+            player.customdata["shield_color"] = plg.shield_color(
+                mode, player.color, player.team.color, index)
+    
+    def new_on_begin(func):
+        def wrapper(*args, **kwargs):
+            
+            func(*args, **kwargs) # original code
+            plg.build_palette(args[0])
+        
+        return wrapper
+    
+    def shield_fx(spaz, color):
+        """ Hooks up shield color brightness, all done by engine curves.
+            color is a static palette color or None to follow character color. """
+        
+        if color is None:
+            # make it 25% darker to reduce intensity of shield light.
+            # Engine does the math and keeps it up when our color changes;
+            # no python per update.
+            tint = bs.newnode(
+                "math",
+                owner=spaz.shield,
+                attrs={"input1": (0.75, 0.75, 0.75), "operation": "multiply"},
+            )
+            spaz.node.connectattr("color", tint, "input2")
+        
+        # hit: flashes on damage and stays dimmer as hitpoints drop.
+        hit = bs.newnode(
+            "math",
+            owner=spaz.shield,
+            attrs={"input1": (1.0, 1.0, 1.0), "operation": "multiply"},
+        )
+        if color is None:
+            tint.connectattr("output", hit, "input2")
+        else:
+            hit.input2 = color
+        
+        # pulse: slow glow, looped by engine.
+        pulse = bs.newnode("math", owner=spaz.shield, attrs={"operation": "multiply"})
+        hit.connectattr("output", pulse, "input2")
+        bs.animate_array(pulse, "input1", 3, {
+            0.0: (1.0, 1.0, 1.0), 0.6: (1.15, 1.15, 1.15), 1.2: (1.0, 1.0, 1.0)
+        }, loop=True)
+        pulse.connectattr("output", spaz.shield, "color")
+        spaz._shield_hit_math = hit
+    
     def new_equip_shield(func):
         def wrapper(*args, **kwargs):
             
             func(*args, **kwargs) # original code
             
-            # make it 25% darker to reduce intensity of shield light
-            r = args[0].node.color[0] * 0.75
-            g = args[0].node.color[1] * 0.75
-            b = args[0].node.color[2] * 0.75
+            spaz = args[0]
+            # already tied to this shield? (it gets refilled on re-equip)
+            hit = getattr(spaz, "_shield_hit_math", None)
+            if hit is not None and hit.exists():
+                bs.animate_array(hit, "input1", 3, {0.0: (1.0, 1.0, 1.0)})
+                return
+            
+            activity = bs.getactivity(doraise=False)
+            mode = (
+                None if activity is None
+                else activity.customdata.get("shield_palette_mode")
+            )
+            color = None
+            if mode is not None:
+                player = getattr(spaz, "source_player", None)
+                if player is not None:
+                    color = player.customdata.get("shield_color")
+                    if color is None:
+                        # joined after begin.
+                        color = player.customdata["shield_color"] = plg.shield_color(
+                            mode, player.color, player.team.color,
+                            len(activity.players) - 1)
+                else:
+                    color = plg.shield_color(mode, spaz.node.color, spaz.node.color, 0)
+            
+            plg.shield_fx(spaz, color)
+        
+        return wrapper
+    
+    def new_handlemessage(func):
+        def wrapper(*args, **kwargs):
+            
+            spaz, msg = args[0], args[1]
+            hitpoints = spaz.shield_hitpoints if spaz.shield else None
+            
+            result = func(*args, **kwargs) # original code
             
-            args[0].shield.color = (r, g, b)
+            if not isinstance(msg, bs.HitMessage) or hitpoints is None:
+                return result
+            hit = getattr(spaz, "_shield_hit_math", None)
+            if (
+                spaz.shield and hit is not None and hit.exists()
+                and spaz.shield_hitpoints < hitpoints
+            ):
+                # flash, then settle at brightness of remaining hitpoints.
+                level = 0.35 + 0.65 * max(spaz.shield_hitpoints, 0) / spaz.shield_hitpoints_max
+                bs.animate_array(hit, "input1", 3, {
+                    0.0: (2.5, 2.5, 2.5), 0.15: (level, level, level)
+                })
+            return result
         
         return wrapper
     
-    Spaz.equip_shields = new_equip_shield(Spaz.equip_shields)
\ No newline at end of file
+    bs.GameActivity.on_begin = new_on_begin(bs.GameActivity.on_begin)
+    Spaz.equip_shields = new_equip_shield(Spaz.equip_shields)
+    Spaz.handlemessage = new_handlemessage(Spaz.handlemessage)
@@ -6,33 +6,333 @@
     
     Function:
         Holds text message of party window's text field.
+        Drafts are kept per server and saved in app config, so they
+        survive restarts too.
+        Sent messages can be recalled with up/down buttons beside the field.
+        Messages are sent through a paced queue, so bursts of commands don't
+        get us throttled or kicked by servers.
+        "Tab" button completes the last typed word to a player/client name
+        of the roster; press again to cycle through matches.
 """
 
 from __future__ import annotations 
 from typing import cast
+from collections import deque
 
 import bauiv1 as bui
+import bascenev1 as bs
 from bauiv1lib.party import PartyWindow
+
+class History:
+    """ Fixed size ring buffer of sent messages; old ones get overwritten. """
+    
+    __slots__ = ("items", "start", "size", "cursor")
+    
+    def __init__(self, capacity: int) -> None:
+        self.items: list[str | None] = [None] * capacity
+        self.start = 0 # index of oldest message
+        self.size = 0
+        # how far back we're recalling; 0 means not recalling.
+        self.cursor = 0
+    
+    def push(self, text: str) -> None:
+        self.cursor = 0
+        capacity = len(self.items)
+        # same as last one? no need to keep twice.
+        if self.size and self.items[(self.start + self.size - 1) % capacity] == text:
+            return
+        if self.size < capacity:
+            self.items[(self.start + self.size) % capacity] = text
+            self.size += 1
+        else:
+            self.items[self.start] = text
+            self.start = (self.start + 1) % capacity
+    
+    def recall(self, step: int) -> str:
+        """ step 1 goes to older message, -1 to newer; "" past the newest. """
+        
+        self.cursor = max(0, min(self.cursor + step, self.size))
+        if self.cursor == 0:
+            return ""
+        return self.items[(self.start + self.size - self.cursor) % len(self.items)]
+    
+class Trie:
+    """ Prefix tree of roster names; keyed by normalized name, holds full names. """
+    
+    __slots__ = ("root",)
+    
+    def __init__(self) -> None:
+        # char -> child node; None -> full names ending here.
+        self.root: dict = {}
+    
+    def insert(self, key: str, name: str) -> None:
+        node = self.root
+        for char in key:
+            node = node.setdefault(char, {})
+        node.setdefault(None, set()).add(name)
+    
+    def remove(self, key: str, name: str) -> None:
+        path = [self.root]
+        for char in key:
+            node = path[-1].get(char)
+            if node is None:
+                return
+            path.append(node)
+        names = path[-1].get(None)
+        if names is None:
+            return
+        names.discard(name)
+        if not names:
+            del path[-1][None]
+        # prune nodes nothing ends under anymore.
+        for depth in range(len(key), 0, -1):
+            if path[depth]:
+                break
+            del path[depth - 1][key[depth - 1]]
+    
+    def find(self, prefix: str) -> list[str]:
+        node = self.root
+        for char in prefix:
+            node = node.get(char)
+            if node is None:
+                return []
+        found = []
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            for char, child in node.items():
+                if char is None:
+                    found.extend(child)
+                else:
+                    stack.append(child)
+        return sorted(found)
     
 # ba_meta export babase.Plugin
 class plg(bui.Plugin):
     """ Our plugin type for the game """
     
-    # The party window text field's text; that to be hold.
-    text: str = ""
+    # app config key of drafts; {server: text}, most recent server last.
+    CONFIG_KEY = "Hold Party Text Drafts"
+    # servers to remember drafts for.
+    MAX_SERVERS = 20
+    # seconds to wait after a close before saving config to disk.
+    SAVE_DELAY = 3.0
+    
+    save_timer: bui.AppTimer | None = None
+    
+    # roster names for completion; updated as people join/leave.
+    names = Trie()
+    roster_names: set[str] = set()
+    # last completion, to cycle on next press:
+    # (where the completed name starts in text, matches, index)
+    completion: tuple[int, list[str], int] | None = None
+    # sent messages; shared by all party windows.
+    history = History(50)
+    
+    # Outgoing chat; token bucket lets BURST messages go at once,
+    # then one per 1/SEND_RATE seconds.
+    BURST = 3
+    SEND_RATE = 1.0
+    # (server key, message); only sent to the server it was typed for.
+    send_queue: deque[tuple[str, str]] = deque()
+    tokens: float = BURST
+    last_refill = 0.0
+    send_timer: bui.AppTimer | None = None
+    
+    def server_key() -> str:
+        """ Key of the server we're connected to ("" when not connected). """
+        
+        info = bs.get_connection_to_host_info_2()
+        if info is None:
+            return ""
+        if info.address is not None:
+            return f"{info.address}:{info.port}"
+        return info.name
+    
+    def drafts() -> dict[str, str]:
+        # config is already in memory; no disk touched here.
+        return bui.app.config.setdefault(plg.CONFIG_KEY, {})
+    
+    def hold(text: str) -> None:
+        drafts = plg.drafts()
+        key = plg.server_key()
+        # nothing new to save; no disk write for just a window toggle.
+        if drafts.get(key, "") == text:
+            return
+        drafts.pop(key, None)
+        if text:
+            drafts[key] = text
+            while len(drafts) > plg.MAX_SERVERS:
+                del drafts[next(iter(drafts))] # least recently used
+        
+        # a burst of closes saves just once.
+        if plg.save_timer is None:
+            plg.save_timer = bui.AppTimer(plg.SAVE_DELAY, plg.save)
+    
+    def save() -> None:
+        plg.save_timer = None
+        bui.app.config.commit()
+    
+    def on_app_suspend(self) -> None:
+        if plg.save_timer is not None:
+            plg.save()
+    
+    on_app_shutdown = on_app_suspend
+    
     def new_init(func: function) -> function:
         def wrapper(*args, **kwargs):
             func(*args, **kwargs) # original code
-            bui.textwidget(edit=args[0]._text_field, text=plg.text)
+            self = args[0]
+            text = plg.drafts().get(plg.server_key(), "")
+            bui.textwidget(edit=self._text_field, text=text)
+            
+            plg.history.cursor = 0
+            for label, step, y in (
+                (bui.SpecialChar.UP_ARROW, 1, 62),
+                (bui.SpecialChar.DOWN_ARROW, -1, 38),
+            ):
+                bui.buttonwidget(
+                    parent=self._root_widget,
+                    position=(10, y),
+                    size=(28, 20),
+                    label=bui.charstr(label),
+                    color=(0.4, 0.4, 0.6),
+                    textcolor=(0.8, 0.8, 0.8),
+                    button_type="square",
+                    autoselect=True,
+                    on_activate_call=bui.Call(plg.recall, self, step),
+                )
+            bui.buttonwidget(
+                parent=self._root_widget,
+                position=(10, 86),
+                size=(28, 20),
+                label="Tab",
+                text_scale=0.6,
+                color=(0.4, 0.4, 0.6),
+                textcolor=(0.8, 0.8, 0.8),
+                button_type="square",
+                autoselect=True,
+                on_activate_call=bui.Call(plg.complete, self),
+            )
+            plg.completion = None
+            plg.update_names()
         
         return wrapper
         
     PartyWindow.__init__ = new_init(PartyWindow.__init__)    
+    
+    def recall(party_window: PartyWindow, step: int) -> None:
+        if not party_window._text_field:
+            return
+        bui.textwidget(edit=party_window._text_field, text=plg.history.recall(step))
+    
+    def queue_send(text: str) -> None:
+        # same message already waiting? send it once.
+        entry = (plg.server_key(), text)
+        if entry not in plg.send_queue:
+            plg.send_queue.append(entry)
+        if plg.send_timer is None:
+            plg.pump()
+    
+    def pump() -> None:
+        """ Sends queued messages we have tokens for; comes back for the rest. """
+        
+        plg.send_timer = None
+        now = bui.apptime()
+        plg.tokens = min(
+            plg.BURST, plg.tokens + (now - plg.last_refill) * plg.SEND_RATE)
+        plg.last_refill = now
+        
+        server = plg.server_key()
+        while plg.send_queue and plg.tokens >= 1.0:
+            key, text = plg.send_queue.popleft()
+            if key != server:
+                continue # left that server; not for this one.
+            bs.chatmessage(text)
+            plg.tokens -= 1.0
+        
+        # keeps going even after party window is closed.
+        if plg.send_queue:
+            plg.send_timer = bui.AppTimer(
+                (1.0 - plg.tokens) / plg.SEND_RATE, plg.pump)
+    
+    def normalize(name: str) -> str:
+        # same as remove_private_use_chars of specific mute; icons away.
+        return "".join(
+            c for c in name if not (0xE000 <= ord(c) <= 0xF8FF)
+        ).strip().lower()
+    
+    def update_names() -> None:
+        """ Adds/removes just the names that changed in roster. """
+        
+        names = set()
+        for client in bs.get_game_roster():
+            names.add(client["display_string"])
+            names.update(player["name_full"] for player in client["players"])
+        
+        for name in names - plg.roster_names:
+            plg.names.insert(plg.normalize(name), name)
+        for name in plg.roster_names - names:
+            plg.names.remove(plg.normalize(name), name)
+        plg.roster_names = names
+    
+    def complete(party_window: PartyWindow) -> None:
+        if not party_window._text_field:
+            return
+        text = cast(str, bui.textwidget(query=party_window._text_field))
+        
+        completion = plg.completion
+        if completion is not None and text[completion[0]:] == completion[1][completion[2]]:
+            # pressed again; next match.
+            start, matches, index = completion
+            index = (index + 1) % len(matches)
+        else:
+            # names can have spaces; so longest typed tail that some name
+            # starts with; "/kick player o" -> "player o".
+            index = 0
+            for start in [0] + [i + 1 for i, c in enumerate(text) if c == " "]:
+                prefix = plg.normalize(text[start:])
+                matches = plg.names.find(prefix) if prefix else []
+                if matches:
+                    break
+            else:
+                return
+        
+        plg.completion = (start, matches, index)
+        text = text[:start] + matches[index]
+        bui.textwidget(edit=party_window._text_field, text=text)
+    
+    def new_update(func):
+        def wrapper(*args, **kwargs) -> None:
+            
+            func(*args, **kwargs) # original code
+            plg.update_names()
+            
+        return wrapper
+        
+    PartyWindow._update = new_update(PartyWindow._update)
+    
+    def new_send_chat_message(func):
+        def wrapper(*args, **kwargs) -> None:
+            
+            text = cast(str, bui.textwidget(query=args[0]._text_field)).strip()
+            if not text:
+                func(*args, **kwargs) # original code
+                return
+            
+            # our queue sends it instead of original code.
+            plg.history.push(text)
+            plg.queue_send(text)
+            bui.textwidget(edit=args[0]._text_field, text="")
+            
+        return wrapper
+        
+    PartyWindow._send_chat_message = new_send_chat_message(PartyWindow._send_chat_message)
 
     def new_close(func):
         def wrapper(*args, **kwargs) -> None:
             
-            plg.text = cast(str, bui.textwidget(query=args[0]._text_field)).strip()
+            plg.hold(cast(str, bui.textwidget(query=args[0]._text_field)).strip())
             func(*args, **kwargs) # original code
             
         return wrapper
@@ -48,9 +48,10 @@ def new_update(func: function) -> function:
                 widget.delete()
             args[0]._chat_texts = []
         
+            plg.sync_roster(args[0]._roster)
             for msg in bs.get_chat_messages():
                 name = msg[0:msg.rfind(':')]
-                if plg.display_msg(name, args[0]._roster):
+                if plg.display_msg(name):
                     args[0]._add_msg(msg)
         
         # some eric code to find position.
@@ -131,6 +132,7 @@ def new_update(func: function) -> function:
                         plr_name = plr_name[:10] + '...'
                     if plr_name not in plg.muted_clients[client_name][1:]:
                         plg.muted_clients[client_name].append(plr_name)
+                        plg.reindex(client_name)
                      
     return wrapper
 
@@ -154,6 +156,7 @@ def _on_press(
             plg.muted_clients[client_name].append(name)
     else:
         plg.muted_clients[client_name][0] = False
+    plg.reindex(client_name)
     
     if bui.app.config.resolve("Chat Muted"):
         cfg = bui.app.config
@@ -183,6 +186,7 @@ def new_pmsc(func: function) -> function:
                     plg.muted_clients[display_str][0] = mute_state
                 else:
                     plg.muted_clients[display_str] = [mute_state, display_str]
+                plg.reindex(display_str)
   
             args[0]._update() # update party
             
@@ -250,8 +254,8 @@ class FakeParty:
     def on_chat_message(self, msg: str) -> None:
         """ ...So we can get msg when someone send message """
         name = msg[0:msg.rfind(':')]
-        roster = bs.get_game_roster()
-        if plg.display_msg(name, roster):
+        plg.sync_roster(bs.get_game_roster())
+        if plg.display_msg(name):
             bui.screenmessage(msg, color=(0.2, 0.5, 0.2)) 
 
 # ba_meta export babase.Plugin
@@ -264,6 +268,13 @@ class plg(bui.Plugin):
     muted_clients: dict[str, list] = {}
     # contains speaker type button and cross image widgets.
     widgets: list[bui.Widget] = []
+    # sender name -> muted clients(in roster) having that name;
+    # so checking a message is one lookup.
+    muted_names: dict[str, set[str]] = {}
+    # names each client is in muted_names under.
+    indexed_names: dict[str, list[str]] = {}
+    # display strings of clients in roster.
+    roster_clients: set[str] = set()
     
     # wrapping...
     PartyWindow.close = new_close(PartyWindow.close)
@@ -280,17 +291,35 @@ class plg(bui.Plugin):
         new_party_press(ClassicAppSubsystem.party_icon_activate)
     )
     
-    def display_msg(name: str, roster: list) -> bool:
+    def display_msg(name: str) -> bool:
         """Called to check if given name is muted or not in plg.muted clients"""
-        show_msg = True
-        for client in roster:
-            display_str = client["display_string"]
-            client_names = plg.muted_clients.get(display_str, [False]) 
-            if client_names[0] and name in client_names[1:]:
-                show_msg = False
-                break
-                
-        return show_msg
+        return not plg.muted_names.get(name)
+    
+    def reindex(client_name: str) -> None:
+        """ Updates muted_names after client's mute state/names changed. """
+        
+        for name in plg.indexed_names.pop(client_name, ()):
+            owners = plg.muted_names[name]
+            owners.discard(client_name)
+            if not owners:
+                del plg.muted_names[name]
+        
+        client_names = plg.muted_clients.get(client_name, [False])
+        if client_names[0] and client_name in plg.roster_clients:
+            for name in client_names[1:]:
+                plg.muted_names.setdefault(name, set()).add(client_name)
+            plg.indexed_names[client_name] = client_names[1:]
+    
+    def sync_roster(roster: list) -> None:
+        """ Reindexes just the clients that joined/left. """
+        
+        clients = {client["display_string"] for client in roster}
+        if clients == plg.roster_clients:
+            return
+        changed = clients ^ plg.roster_clients
+        plg.roster_clients = clients
+        for client_name in changed:
+            plg.reindex(client_name)
     
     def remove_private_use_chars(text: str) -> str:
         return "".join(c for c in text if not (0xE000 <= ord(c) <= 0xF8FF))